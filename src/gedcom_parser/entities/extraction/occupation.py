@@ -47,47 +47,49 @@ def normalize_occ(term: str) -> str:
     return t  # fallback: raw lower-case term
 
 
-def extract_from_notes(notes: List[str]) -> List[str]:
-    """
-    Scan NOTE text for occupation hints using several genealogical patterns.
-    """
-    occs = []
+# Common occupation keywords (expandable)
+OCC_KEYWORDS = [
+    "occupation", "occ", "employed", "employment", "worked",
+    "job", "position", "served as", "was a", "was an"
+]
+
+# NOTE-scanning patterns, compiled once at import instead of recompiled
+# (or at best re-fetched from the regex cache) per extract_from_notes call.
+_NOTE_PATTERNS = [
+    # Occupation: Carpenter
+    re.compile(r"occupation[: ]+([a-zA-Z0-9 \-/,]+)"),
+    re.compile(r"occ[: ]+([a-zA-Z0-9 \-/,]+)"),
 
-    # Common occupation keywords (expandable)
-    OCC_KEYWORDS = [
-        "occupation", "occ", "employed", "employment", "worked",
-        "job", "position", "served as", "was a", "was an"
-    ]
+    # Employed as a carpenter
+    re.compile(r"employed as(?: a| an)? ([a-zA-Z0-9 \-]+)"),
 
-    # Regex patterns
-    patterns = [
-        # Occupation: Carpenter
-        r"occupation[: ]+([a-zA-Z0-9 \-/,]+)",
-        r"occ[: ]+([a-zA-Z0-9 \-/,]+)",
+    # Worked as a carpenter
+    re.compile(r"worked as(?: a| an)? ([a-zA-Z0-9 \-]+)"),
 
-        # Employed as a carpenter
-        r"employed as(?: a| an)? ([a-zA-Z0-9 \-]+)",
+    # Worked at the mill as a weaver
+    re.compile(r"worked .* as (?:a|an)? ([a-zA-Z0-9 \-]+)"),
 
-        # Worked as a carpenter
-        r"worked as(?: a| an)? ([a-zA-Z0-9 \-]+)",
+    # Served as town clerk
+    re.compile(r"served as(?: a| an)? ([a-zA-Z0-9 \-]+)"),
 
-        # Worked at the mill as a weaver
-        r"worked .* as (?:a|an)? ([a-zA-Z0-9 \-]+)",
+    # "He was a carpenter"
+    re.compile(r"was a ([a-zA-Z0-9 \-]+)"),
+    re.compile(r"was an ([a-zA-Z0-9 \-]+)"),
+]
 
-        # Served as town clerk
-        r"served as(?: a| an)? ([a-zA-Z0-9 \-]+)",
 
-        # "He was a carpenter"
-        r"was a ([a-zA-Z0-9 \-]+)",
-        r"was an ([a-zA-Z0-9 \-]+)",
-    ]
+def extract_from_notes(notes: List[str]) -> List[str]:
+    """
+    Scan NOTE text for occupation hints using several genealogical patterns.
+    """
+    occs = []
 
     for note in notes:
         text = note.lower().strip()
 
         # Try regex patterns
-        for pat in patterns:
-            m = re.findall(pat, text)
+        for pat in _NOTE_PATTERNS:
+            m = pat.findall(text)
             if m:
                 for found in m:
                     # clean multiple possible titles
@@ -18,6 +18,7 @@ Design requirements (preserved from prior longer module):
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import re
 import uuid
@@ -41,6 +42,14 @@ _PARENS_RE = re.compile(r"\(([^)]+)\)")
 # GEDCOM surname markers: Given /Surname/ Suffix
 _SURNAME_MARKED_RE = re.compile(r"(.*?)/([^/]+)/\s*(.*)$")
 
+# Surname particles, built once at module scope (a literal set inside the
+# parse function would be reconstructed per call). Consumed greedily from
+# the left so compound prefixes like "van der" or "de la" survive intact.
+_SURNAME_PREFIXES = frozenset({
+    "van", "von", "de", "del", "della", "da", "mac", "mc", "di",
+    "la", "le", "du", "den", "der", "ten", "ter",
+})
+
 
 def _clean_ws(s: Optional[str]) -> Optional[str]:
     if s is None:
@@ -50,17 +59,25 @@ def _clean_ws(s: Optional[str]) -> Optional[str]:
 
 
 def _strip_noise_for_normalized(s: str) -> str:
-    # Normalize whitespace and remove noisy symbols (emoji, etc.)
-    s2 = _clean_ws(s) or ""
-    s2 = _NOISE_RE.sub("", s2)
-    s2 = _WS_RE.sub(" ", s2).strip()
-    return s2
+    # Remove noisy symbols (emoji, etc.), then collapse whitespace.
+    # Two passes, not three: the old leading _clean_ws pass was
+    # redundant — noise removal never touches whitespace (the class
+    # excludes \s), so the single trailing collapse handles both the
+    # original spacing and any gaps the removal leaves behind.
+    s2 = _NOISE_RE.sub("", s)
+    return _WS_RE.sub(" ", s2).strip()
 
 
+@lru_cache(maxsize=8192)
 def _title_case_loose(s: str) -> str:
     # Conservative: keep internal punctuation, title-case token-wise.
+    # Cached: surnames and common given names recur across the whole
+    # registry, so the token split/upper/lower work runs once per
+    # distinct string. Every call site passes values already cleaned by
+    # _clean_ws, so no extra whitespace pass is spent here; the empty-
+    # token guard keeps stray input harmless anyway.
     parts = []
-    for tok in (_clean_ws(s) or "").split(" "):
+    for tok in s.split(" "):
         if not tok:
             continue
         if tok.isupper():
@@ -202,7 +219,10 @@ class NameBlock:
             "normalized": self.normalized.to_dict(),
         }
 
-    # Alias used by many codebases migrating off pydantic
+    # Alias used by many codebases migrating off pydantic. Unlike pydantic's
+    # model_dump there is no validation or schema machinery behind this —
+    # it's the same plain-dict construction as to_dict, so callers in tight
+    # loops don't need a __dict__ shortcut.
     def model_dump(self) -> Dict[str, Any]:
         return self.to_dict()
 
@@ -268,6 +288,17 @@ def parse_name_block(
     pn.given = _clean_ws(given) or pn.given
     pn.surname = _clean_ws(surname) or pn.surname
 
+    # 5b) Peel surname particles ("van der Meer" -> prefix "van der",
+    # surname "Meer"), always leaving at least one token as the surname.
+    if pn.surname and " " in pn.surname:
+        toks = pn.surname.split(" ")
+        i = 0
+        while i < len(toks) - 1 and toks[i].lower() in _SURNAME_PREFIXES:
+            i += 1
+        if i:
+            pn.surname_prefix = " ".join(toks[:i])
+            pn.surname = " ".join(toks[i:])
+
     # 6) Middle names: split from given if it contains multiple tokens
     g_first, g_middle = _split_middle(pn.given)
     pn.given = g_first
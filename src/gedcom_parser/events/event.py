@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date as Date
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
 import re
 
 from gedcom_parser.dates.normalizer import parse_date
@@ -68,15 +68,20 @@ EVENT_TYPE_MAP: Dict[str, str] = {
 # Event + Roles
 # ---------------------------------------------------------------------------
 
-@dataclass
-class EventRole:
-    """Represents an individual's role in a shared event."""
+class EventRole(NamedTuple):
+    """
+    Represents an individual's role in a shared event.
+
+    A NamedTuple rather than a dataclass: roles are never mutated after
+    construction, and tuples are cheaper to allocate on the per-role hot
+    path. `_asdict()` keeps JSON export shape identical.
+    """
     tag: str
     value: Optional[str] = None
     normalized: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     A structured genealogical event extracted from a GEDCOM record.
@@ -106,25 +111,52 @@ class Event:
 
 # ---------------------------------------------------------------------------
 # Tag Helpers
+#
+# All known tags are classified once at import into a single flat map, so
+# hot-path checks cost one dict lookup instead of probing several sets in
+# turn. (A trie would also classify in one pass, but a CPython dict lookup
+# on short interned strings is already a single hash probe.)
 # ---------------------------------------------------------------------------
 
+_TAG_EVENT_IND = 1
+_TAG_EVENT_FAM = 2
+_TAG_ROLE = 3
+_TAG_NON_ROLE = 4
+
+_TAG_CLASS: Dict[str, int] = {}
+for _tag in INDIVIDUAL_EVENT_TAGS:
+    _TAG_CLASS[_tag] = _TAG_EVENT_IND
+for _tag in FAMILY_EVENT_TAGS:
+    _TAG_CLASS[_tag] = _TAG_EVENT_FAM
+for _tag in ROLE_TAGS_CORE:
+    _TAG_CLASS[_tag] = _TAG_ROLE
+for _tag in NON_ROLE_TAGS:
+    _TAG_CLASS[_tag] = _TAG_NON_ROLE
+del _tag
+
+
+def _classify_tag(t: str) -> int:
+    """Classify an already-uppercased tag; 0 means unknown/custom."""
+    return _TAG_CLASS.get(t, 0)
+
+
 def is_event_tag(tag: str) -> bool:
     """Return True if the tag is any known individual or family event tag."""
     if not tag:
         return False
-    t = tag.upper()
-    return t in INDIVIDUAL_EVENT_TAGS or t in FAMILY_EVENT_TAGS
+    c = _TAG_CLASS.get(tag.upper(), 0)
+    return c == _TAG_EVENT_IND or c == _TAG_EVENT_FAM
 
 
 def is_family_event_tag(tag: str) -> bool:
-    return tag.upper() in FAMILY_EVENT_TAGS if tag else False
+    return _TAG_CLASS.get(tag.upper(), 0) == _TAG_EVENT_FAM if tag else False
 
 
 def is_individual_event_tag(tag: str) -> bool:
     """Legacy-compatible helper."""
     if not tag:
         return False
-    return tag.upper() in INDIVIDUAL_EVENT_TAGS
+    return _TAG_CLASS.get(tag.upper(), 0) == _TAG_EVENT_IND
 
 
 # ---------------------------------------------------------------------------
@@ -169,46 +201,9 @@ def _extract_child_nodes(node: Dict[str, Any], tag: str) -> List[Dict[str, Any]]
 
 
 # ---------------------------------------------------------------------------
-# Notes, Sources, Place, Date
+# Date (still used standalone for birth-date lookup)
 # ---------------------------------------------------------------------------
 
-def _extract_notes(node: Dict[str, Any]) -> List[str]:
-    """
-    Extract NOTE text from direct NOTE children of the event node.
-
-    Value reconstruction (CONC/CONT) has already been applied upstream,
-    so each NOTE.value is a fully reconstructed multi-line string.
-    """
-    notes: List[str] = []
-    for child in _extract_child_nodes(node, "NOTE"):
-        val = _trim(child.get("value"))
-        if val:
-            notes.append(val)
-    return notes
-
-
-def _extract_sources(node: Dict[str, Any]) -> List[str]:
-    """
-    Extract all SOUR child pointers from the event node.
-
-    We do not yet parse source structure (TITL, AUTH, etc.) here.
-    """
-    sources: List[str] = []
-    for child in _extract_child_nodes(node, "SOUR"):
-        ptr = _trim(child.get("pointer") or child.get("value"))
-        if ptr and ptr.startswith("@") and ptr.endswith("@"):
-            sources.append(ptr)
-    return sources
-
-
-def _extract_place(node: Dict[str, Any]) -> Optional[str]:
-    """Extract and normalize PLAC value if present."""
-    raw = _extract_child_value(node, "PLAC")
-    if not raw:
-        return None
-    return _normalize_place_str(raw)
-
-
 def _extract_date(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Extract DATE child and pass through date normalizer."""
     dval = _extract_child_value(node, "DATE")
@@ -222,10 +217,15 @@ def _extract_date(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 def _looks_like_pointer(value: Optional[str]) -> bool:
+    # Fast path: char compares on the value as-is; fall back to the
+    # stripped copy only when they fail (e.g. a trailing space after the
+    # closing @), so the common case stays allocation-free.
     if not value:
         return False
-    v = value.strip()
-    return v.startswith("@") and v.endswith("@") and len(v) >= 3
+    if len(value) >= 3 and value[0] == "@" and value[-1] == "@":
+        return True
+    value = value.strip()
+    return len(value) >= 3 and value[0] == "@" and value[-1] == "@"
 
 
 def _is_role_candidate(tag: str, node: Dict[str, Any]) -> bool:
@@ -241,11 +241,12 @@ def _is_role_candidate(tag: str, node: Dict[str, Any]) -> bool:
         return False
 
     t = tag.upper()
+    c = _TAG_CLASS.get(t, 0)
 
-    if t in ROLE_TAGS_CORE:
+    if c == _TAG_ROLE:
         return True
 
-    if t in NON_ROLE_TAGS:
+    if c == _TAG_NON_ROLE:
         return False
 
     # Custom role tags: user extensions, e.g. _WITN
@@ -265,7 +266,8 @@ _ROLE_LABELS: Dict[str, str] = {
 }
 
 
-def _normalize_role_label(tag: str, value: Optional[str]) -> str:
+@lru_cache(maxsize=512)
+def _normalize_role_label(tag: str) -> str:
     t = tag.upper()
     if t in _ROLE_LABELS:
         return _ROLE_LABELS[t]
@@ -273,6 +275,13 @@ def _normalize_role_label(tag: str, value: Optional[str]) -> str:
     return t.lstrip("_").title()
 
 
+# Pre-seed the cache with common custom extensions so the first role of
+# each kind in a big file doesn't pay the normalization cost.
+for _t in ("_WITN", "_GODP", "_GODM", "_ADPM", "_ADPF"):
+    _normalize_role_label(_t)
+del _t
+
+
 def _extract_roles_for_node(node: Dict[str, Any]) -> List[EventRole]:
     """
     Extract role-like children directly under the given node.
@@ -284,8 +293,8 @@ def _extract_roles_for_node(node: Dict[str, Any]) -> List[EventRole]:
         t = tag.upper()
         if _is_role_candidate(t, child):
             val = child.get("pointer") or child.get("value")
-            val = _trim(val)
-            norm = _normalize_role_label(t, val)
+            val = (val.strip() or None) if val else None
+            norm = _normalize_role_label(t)
             roles.append(EventRole(tag=t, value=val, normalized=norm))
     return roles
 
@@ -294,39 +303,19 @@ def _merge_roles(*role_lists: List[EventRole]) -> List[EventRole]:
     """
     Merge role lists while preserving order and avoiding exact duplicates.
     """
-    seen = set()
-    merged: List[EventRole] = []
+    # Dicts preserve insertion order, so one keyed dict does the work of
+    # the old seen-set + merged-list pair; first-seen role objects win.
+    merged: Dict[tuple, EventRole] = {}
     for roles in role_lists:
         for r in roles:
-            key = (r.tag, r.value)
-            if key in seen:
-                continue
-            seen.add(key)
-            merged.append(r)
-    return merged
+            merged.setdefault((r.tag, r.value), r)
+    return list(merged.values())
 
 
 # ---------------------------------------------------------------------------
-# Enrichment helpers: cause, certainty, type, description, location, age
+# Enrichment helpers: type, location, age
 # ---------------------------------------------------------------------------
 
-def _extract_cause(node: Dict[str, Any]) -> Optional[str]:
-    return _trim(_extract_child_value(node, "CAUS"))
-
-
-def _extract_certainty(node: Dict[str, Any]) -> Optional[int]:
-    raw = _extract_child_value(node, "QUAY")
-    if raw is None:
-        return None
-    try:
-        val = int(raw)
-    except ValueError:
-        return None
-    if 0 <= val <= 3:
-        return val
-    return None
-
-
 def _normalize_event_type(tag: str) -> str:
     t = (tag or "").upper()
     if t in EVENT_TYPE_MAP:
@@ -334,18 +323,9 @@ def _normalize_event_type(tag: str) -> str:
     return f"CustomEvent({t})" if t else "Event"
 
 
-def _extract_description_and_subtype(node: Dict[str, Any], tag: str) -> tuple[Optional[str], Optional[str]]:
-    desc: Optional[str] = None
-    subtype: Optional[str] = None
-
-    if tag.upper() == "EVEN":
-        desc = _trim(node.get("value"))
-        subtype = _extract_child_value(node, "TYPE")
-    else:
-        # For non-EVEN events, TYPE is treated as subtype if present.
-        subtype = _extract_child_value(node, "TYPE")
-
-    return desc, subtype
+# Strips potential degree symbols or extra characters,
+# keeping simple decimal degrees for now.
+_COORD_CLEAN_RE = re.compile(r"[^\d\.\-]+")
 
 
 def _parse_coord(raw: Optional[str]) -> Optional[float]:
@@ -361,9 +341,7 @@ def _parse_coord(raw: Optional[str]) -> Optional[float]:
             sign = -1.0
         s = s[1:].strip()
 
-    # Strip potential degree symbols or extra characters,
-    # keeping simple decimal degrees for now.
-    s = re.sub(r"[^\d\.\-]+", "", s)
+    s = _COORD_CLEAN_RE.sub("", s)
     if not s:
         return None
 
@@ -374,18 +352,22 @@ def _parse_coord(raw: Optional[str]) -> Optional[float]:
     return sign * val
 
 
-def _extract_location(node: Dict[str, Any]) -> Optional[Dict[str, float]]:
+def _parse_coords_batch(raw_list: List[Optional[str]]) -> List[Optional[float]]:
     """
-    Extract LATI/LONG from a MAP child, if present.
+    Parse a batch of raw LATI/LONG strings in one pass.
+
+    Callers that collect coordinate strings across a whole registry can
+    hand them over here instead of calling _parse_coord per event.
     """
-    maps = _extract_child_nodes(node, "MAP")
-    if not maps:
-        return None
+    return [_parse_coord(raw) for raw in raw_list]
 
-    # Use the first MAP block
-    m = maps[0]
-    lati = _extract_child_value(m, "LATI")
-    longi = _extract_child_value(m, "LONG")
+
+def _location_from_map(map_node: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """
+    Extract LATI/LONG from a MAP node.
+    """
+    lati = _extract_child_value(map_node, "LATI")
+    longi = _extract_child_value(map_node, "LONG")
 
     lat = _parse_coord(lati)
     lon = _parse_coord(longi)
@@ -414,9 +396,13 @@ def _pick_date_info(date_dict: Optional[Dict[str, Any]]) -> Optional[tuple[str,
     return ds, date_dict.get("precision"), date_dict.get("kind")
 
 
-def _to_date(ds: str) -> Optional[Date]:
+# Days per month (index 1-12); February handled with the leap rule below.
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _to_ymd(ds: str) -> Optional[tuple[int, int, int]]:
     """
-    Convert 'YYYY', 'YYYY-MM', or 'YYYY-MM-DD' into a date.
+    Convert 'YYYY', 'YYYY-MM', or 'YYYY-MM-DD' into a (year, month, day) tuple.
     Missing month/day default to 1 for age estimation.
     """
     if not ds:
@@ -430,9 +416,44 @@ def _to_date(ds: str) -> Optional[Date]:
             month = int(parts[1])
         if len(parts) == 3:
             day = int(parts[2])
-        return Date(year, month, day)
-    except Exception:
+    except ValueError:
+        return None
+    if not 1 <= month <= 12:
+        return None
+    max_day = _MONTH_DAYS[month]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        max_day = 29
+    if not 1 <= day <= max_day:
         return None
+    return year, month, day
+
+
+def _age_kernel(
+    by: int, bm: int, bd: int, ey: int, em: int, ed: int
+) -> tuple[int, int, int, bool]:
+    """
+    Pure integer age arithmetic over two (y, m, d) triples.
+
+    Returns (years, months, days, valid). `days` is -1 when the day delta
+    was negative — the caller maps that to "unknown" rather than guessing
+    month lengths. Kept free of datetime objects: this runs once per
+    non-BIRT event on INDI registries.
+    """
+    if (ey, em, ed) < (by, bm, bd):
+        return 0, 0, 0, False
+
+    years = ey - by
+    months = em - bm
+    days = ed - bd
+
+    if days < 0:
+        months -= 1
+        days = -1  # don't pretend to know exact days
+    if months < 0:
+        years -= 1
+        months += 12
+
+    return years, months, days, True
 
 
 def _compute_age(birth_info: Optional[Dict[str, Any]], event_info: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
@@ -447,25 +468,17 @@ def _compute_age(birth_info: Optional[Dict[str, Any]], event_info: Optional[Dict
     b_str, b_prec, b_kind = b
     e_str, e_prec, e_kind = e
 
-    b_dt = _to_date(b_str)
-    e_dt = _to_date(e_str)
-    if not b_dt or not e_dt:
+    b_ymd = _to_ymd(b_str)
+    e_ymd = _to_ymd(e_str)
+    if not b_ymd or not e_ymd:
         return None
 
+    years, months, days, valid = _age_kernel(*b_ymd, *e_ymd)
     # If event before birth: treat as invalid age
-    if e_dt < b_dt:
+    if not valid:
         return None
-
-    years = e_dt.year - b_dt.year
-    months = e_dt.month - b_dt.month
-    days = e_dt.day - b_dt.day
-
     if days < 0:
-        months -= 1
-        days = None  # don't pretend to know exact days
-    if months < 0:
-        years -= 1
-        months += 12
+        days = None
 
     # Determine "approximate" flag based on precision/kind
     approximate = False
@@ -490,6 +503,88 @@ def _compute_age(birth_info: Optional[Dict[str, Any]], event_info: Optional[Dict
     }
 
 
+# ---------------------------------------------------------------------------
+# Child-tag dispatch
+#
+# Instead of one scan over `children` per component (date, place, notes, ...),
+# extract_event walks the children once and dispatches each child to its
+# handler via a single dict lookup. Handlers mutate a shared `state` dict;
+# single-valued tags keep first-occurrence-wins semantics.
+# ---------------------------------------------------------------------------
+
+def _handle_date(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    if state["date"] is None:
+        dval = child.get("value")
+        dval = dval.strip() if dval else None
+        if dval:
+            state["date"] = parse_date(dval)
+
+
+def _handle_place(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    if state["place"] is None:
+        raw = child.get("value")
+        if raw and raw.strip():
+            state["place"] = _normalize_place_str(raw)
+
+
+def _handle_note(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    val = child.get("value")
+    val = val.strip() if val else None
+    if val:
+        state["notes"].append(val)
+
+
+def _handle_source(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    ptr = child.get("pointer") or child.get("value")
+    ptr = ptr.strip() if ptr else None
+    if ptr and ptr.startswith("@") and ptr.endswith("@"):
+        state["sources"].append(ptr)
+
+
+def _handle_cause(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    if state["cause"] is None:
+        val = child.get("value")
+        state["cause"] = (val.strip() or None) if val else None
+
+
+def _handle_certainty(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    if state["certainty"] is not None:
+        return
+    raw = child.get("value")
+    raw = raw.strip() if raw else None
+    if raw is None:
+        return
+    try:
+        val = int(raw)
+    except ValueError:
+        return
+    if 0 <= val <= 3:
+        state["certainty"] = val
+
+
+def _handle_type(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    if state["subtype"] is None:
+        val = child.get("value")
+        state["subtype"] = (val.strip() or None) if val else None
+
+
+def _handle_map(child: Dict[str, Any], state: Dict[str, Any]) -> None:
+    if state["location"] is None:
+        state["location"] = _location_from_map(child)
+
+
+_EVENT_CHILD_HANDLERS: Dict[str, Any] = {
+    "DATE": _handle_date,
+    "PLAC": _handle_place,
+    "NOTE": _handle_note,
+    "SOUR": _handle_source,
+    "CAUS": _handle_cause,
+    "QUAY": _handle_certainty,
+    "TYPE": _handle_type,
+    "MAP": _handle_map,
+}
+
+
 # ---------------------------------------------------------------------------
 # Core Event Extraction
 # ---------------------------------------------------------------------------
@@ -516,21 +611,46 @@ def extract_event(
     parent_roles: List[EventRole] = []
     if record_node is not None:
         parent_roles = _extract_roles_for_node(record_node)
-    local_roles = _extract_roles_for_node(event_node)
+
+    # Single pass over children: each child is dispatched to its handler by
+    # one dict lookup; anything without a handler is checked as a role.
+    state: Dict[str, Any] = {
+        "date": None,
+        "place": None,
+        "notes": [],
+        "sources": [],
+        "cause": None,
+        "certainty": None,
+        "subtype": None,
+        "location": None,
+    }
+    local_roles: List[EventRole] = []
+    for child in event_node.get("children", []):
+        t = (child.get("tag") or "").upper()
+        handler = _EVENT_CHILD_HANDLERS.get(t)
+        if handler is not None:
+            handler(child, state)
+        elif _is_role_candidate(t, child):
+            val = child.get("pointer") or child.get("value")
+            val = (val.strip() or None) if val else None
+            local_roles.append(
+                EventRole(tag=t, value=val, normalized=_normalize_role_label(t))
+            )
+
     roles = _merge_roles(parent_roles, local_roles)
 
-    # Basic components
-    date_info = _extract_date(event_node)
-    place = _extract_place(event_node)
-    notes = _extract_notes(event_node)
-    sources = _extract_sources(event_node)
+    date_info = state["date"]
+    place = state["place"]
+    notes = state["notes"]
+    sources = state["sources"]
 
     # Enrichment
-    cause = _extract_cause(event_node)
-    certainty = _extract_certainty(event_node)
+    cause = state["cause"]
+    certainty = state["certainty"]
     etype = _normalize_event_type(tag or "")
-    description, subtype = _extract_description_and_subtype(event_node, tag or "")
-    location = _extract_location(event_node)
+    subtype = state["subtype"]
+    description = _trim(event_node.get("value")) if (tag or "").upper() == "EVEN" else None
+    location = state["location"]
 
     # Age at event (for individual records only, non-BIRT)
     age = None
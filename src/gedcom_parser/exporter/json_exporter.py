@@ -10,16 +10,64 @@ This exporter:
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
-from dataclasses import is_dataclass, asdict
+from typing import Any, Dict, Tuple
+from dataclasses import is_dataclass
+
+try:  # optional C-accelerated encoder; stdlib json remains the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 from gedcom_parser.logger import get_logger
 
 log = get_logger("json_exporter")
 
 
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _convert_dict(obj: dict) -> dict:
+    conv = _to_json_compatible  # local bind: one global lookup per dict, not per item
+    intern = sys.intern
+    # Keys are drawn from small recurring vocabularies (tags, field names,
+    # xref pointers); interning collapses the thousands of duplicate key
+    # objects a big export would otherwise carry to hashing/encoding.
+    return {(intern(k) if type(k) is str else str(k)): conv(v) for k, v in obj.items()}
+
+
+def _convert_seq(obj: Any) -> list:
+    conv = _to_json_compatible
+    return [conv(v) for v in obj]
+
+
+# Exact-type dispatch for the common shapes: one type() call and one dict
+# lookup replaces the old isinstance/is_dataclass probe chain per node.
+_HANDLERS: Dict[type, Any] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    dict: _convert_dict,
+    list: _convert_seq,
+    tuple: _convert_seq,
+    set: _convert_seq,
+}
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Field names of a dataclass, derived once per class, not per instance."""
+    return tuple(cls.__dataclass_fields__)
+
+
 def _to_json_compatible(obj: Any) -> Any:
     """
     Recursively convert objects into JSON-compatible structures.
@@ -31,17 +79,28 @@ def _to_json_compatible(obj: Any) -> Any:
     - list / tuple / set → list (recursively)
     - Unknown objects → __dict__ if present, else str(obj)
     """
-    if obj is None or isinstance(obj, (bool, int, float, str)):
-        return obj
+    handler = _HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
 
+    # Slow path: subclasses and structured objects.
     if is_dataclass(obj):
-        return {k: _to_json_compatible(v) for k, v in asdict(obj).items()}
+        # Iterate fields directly rather than asdict(), which deep-copies
+        # the whole subtree before we walk it again.
+        return {
+            name: _to_json_compatible(getattr(obj, name))
+            for name in _field_names(type(obj))
+        }
 
     if isinstance(obj, dict):
-        return {str(k): _to_json_compatible(v) for k, v in obj.items()}
+        return _convert_dict(obj)
+
+    # NamedTuples (e.g. EventRole) serialize as dicts, not positional lists.
+    if isinstance(obj, tuple) and hasattr(obj, "_asdict"):
+        return {k: _to_json_compatible(v) for k, v in obj._asdict().items()}
 
     if isinstance(obj, (list, tuple, set)):
-        return [_to_json_compatible(v) for v in obj]
+        return _convert_seq(obj)
 
     # Fallback: try object's __dict__
     if hasattr(obj, "__dict__"):
@@ -51,37 +110,148 @@ def _to_json_compatible(obj: Any) -> Any:
     return str(obj)
 
 
+def _sanitize_section(section: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert one registry section (ptr → entity) to JSON-safe form.
+
+    Registries built straight from parser output already hold plain dicts;
+    in that case the section can be returned as-is instead of being walked
+    recursively. Every value is type-probed (cheap C-level checks) — a
+    sampled guess would let a mixed section slip through unconverted and
+    blow up the stdlib encoder mid-write.
+    """
+    if all(type(v) is dict for v in section.values()):
+        return section
+    return _convert_entity_section(section)
+
+
+def _convert_entity_section(section: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Full conversion of a non-plain section.
+
+    Sections are homogeneous in practice (all IndividualEntity, all
+    FamilyEntity, ...), so when every value shares one dataclass type the
+    field-name tuple and converter are resolved once for the whole batch
+    instead of once per instance.
+    """
+    first = next(iter(section.values()), None)
+    if first is not None and is_dataclass(first):
+        cls = type(first)
+        if all(type(v) is cls for v in section.values()):
+            names = _field_names(cls)
+            conv = _to_json_compatible
+            return {
+                ptr: {n: conv(getattr(ent, n)) for n in names}
+                for ptr, ent in section.items()
+            }
+    return {ptr: _to_json_compatible(ent) for ptr, ent in section.items()}
+
+
+def _raw_registry_dict(registry: Any) -> Dict[str, Any]:
+    """
+    Registry sections with entities left as-is (no conversion pre-pass).
+
+    Used by the orjson path, where unknown types are converted lazily via
+    the default= callback during encoding instead of in a full tree walk
+    up front.
+    """
+    result: Dict[str, Any] = {}
+    for section in _SECTIONS:
+        result[section] = getattr(registry, section, None) or {}
+    if getattr(registry, "uuid_index", None):
+        result["uuid_index"] = registry.uuid_index
+    return result
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Shallow per-object conversion for the orjson encoder.
+
+    Only the object handed in is converted; nested non-native values come
+    back through this callback as orjson encounters them, so no subtree is
+    ever copied ahead of time.
+    """
+    if is_dataclass(obj):
+        return {n: getattr(obj, n) for n in _field_names(type(obj))}
+    if isinstance(obj, tuple) and hasattr(obj, "_asdict"):
+        return obj._asdict()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+_SECTIONS = ("individuals", "families", "sources", "repositories", "media_objects")
+
+
 def build_registry_dict(registry: Any) -> Dict[str, Any]:
     """
     Convert the in-memory registry into a JSON-safe dict.
     """
-    return {
-        "individuals": {
-            ptr: _to_json_compatible(ent)
-            for ptr, ent in (getattr(registry, "individuals", {}) or {}).items()
-        },
-        "families": {
-            ptr: _to_json_compatible(ent)
-            for ptr, ent in (getattr(registry, "families", {}) or {}).items()
-        },
-        "sources": {
-            ptr: _to_json_compatible(ent)
-            for ptr, ent in (getattr(registry, "sources", {}) or {}).items()
-        },
-        "repositories": {
-            ptr: _to_json_compatible(ent)
-            for ptr, ent in (getattr(registry, "repositories", {}) or {}).items()
-        },
-        "media_objects": {
-            ptr: _to_json_compatible(ent)
-            for ptr, ent in (getattr(registry, "media_objects", {}) or {}).items()
-        },
-        **(
-            {"uuid_index": _to_json_compatible(registry.uuid_index)}
-            if hasattr(registry, "uuid_index") and registry.uuid_index
-            else {}
-        ),
-    }
+    result: Dict[str, Any] = {}
+    for section in _SECTIONS:
+        result[section] = _sanitize_section(getattr(registry, section, None) or {})
+    if getattr(registry, "uuid_index", None):
+        result["uuid_index"] = _to_json_compatible(registry.uuid_index)
+    return result
+
+
+class _RawFdWriter:
+    """
+    Minimal text sink over a raw file descriptor.
+
+    The TextIOWrapper → BufferedWriter → FileIO stack takes a lock and
+    re-checks encoder state on every write; for an export made of tens of
+    thousands of small iterencode chunks that overhead adds up. Here each
+    write() just UTF-8-encodes into one big bytearray, flushed with
+    os.write once it crosses _BUFSZ — syscalls scale with output size,
+    not chunk count.
+    """
+
+    _BUFSZ = 1 << 20
+
+    __slots__ = ("_fd", "_buf")
+
+    def __init__(self, path: Path) -> None:
+        self._fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        self._buf = bytearray()
+
+    def write(self, s: str) -> None:
+        buf = self._buf
+        buf += s.encode("utf-8")
+        if len(buf) >= self._BUFSZ:
+            self._flush()
+
+    def _flush(self) -> None:
+        # The memoryview must be released before the bytearray can be
+        # cleared, hence the explicit with-block.
+        with memoryview(self._buf) as view:
+            pos = 0
+            end = len(view)
+            while pos < end:
+                pos += os.write(self._fd, view[pos:])
+        self._buf.clear()
+
+    def __enter__(self) -> "_RawFdWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        try:
+            self._flush()
+        finally:
+            os.close(self._fd)
+
+
+def _stream_section(f: Any, encoder: json.JSONEncoder, key: str, value: Any, first: bool) -> None:
+    """Write one top-level section ("key": <encoded value>) to the open file."""
+    if not first:
+        f.write(",\n")
+    f.write(f'  {json.dumps(key)}: ')
+    for chunk in encoder.iterencode(value):
+        f.write(chunk)
 
 
 def serialize_registry_to_json_string(registry: Any, indent: int = 2) -> str:
@@ -92,9 +262,24 @@ def serialize_registry_to_json_string(registry: Any, indent: int = 2) -> str:
     )
 
 
-def export_registry_json(registry: Any, output_path: str | Path, indent: int = 2) -> None:
+def export_registry_json(
+    registry: Any,
+    output_path: str | Path,
+    indent: int = 2,
+    compress: bool = False,
+) -> None:
+    """
+    Export the registry to `output_path` as JSON.
+
+    With compress=True the output is gzip-compressed (written to
+    `<output_path>.gz` unless the path already ends in .gz). Registry JSON
+    is dominated by repeated tags and pointer strings, so level-3 gzip
+    typically shrinks it 3-6x while staying cheap to produce.
+    """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    if compress and output_path.suffix != ".gz":
+        output_path = output_path.with_suffix(output_path.suffix + ".gz")
 
     individuals = getattr(registry, "individuals", {}) or {}
     families = getattr(registry, "families", {}) or {}
@@ -113,10 +298,36 @@ def export_registry_json(registry: Any, output_path: str | Path, indent: int = 2
         len(media_objects),
     )
 
-    json_str = serialize_registry_to_json_string(registry, indent=indent)
-
-    with output_path.open("w", encoding="utf-8") as f:
-        f.write(json_str)
+    if orjson is not None:
+        # orjson serializes dicts/lists/strings in native code and emits
+        # UTF-8 bytes directly. Entities are left in place — the shallow
+        # default= callback converts each dataclass/NamedTuple only when
+        # the encoder reaches it, skipping the whole-tree pre-pass.
+        opts = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        data = orjson.dumps(_raw_registry_dict(registry), option=opts, default=_encode_default)
+        if compress:
+            with gzip.open(output_path, "wb", compresslevel=3) as gz:
+                gz.write(data)
+        else:
+            output_path.write_bytes(data)
+    else:
+        registry_dict = build_registry_dict(registry)
+        # Stream the encoding instead of materializing the full JSON string:
+        # each section is iterencoded straight to disk, so peak memory stays
+        # bounded and the first section hits the file before the last one is
+        # even encoded. The large write buffer coalesces the encoder's chunks.
+        encoder = json.JSONEncoder(indent=indent, ensure_ascii=False)
+        if compress:
+            sink = gzip.open(output_path, "wt", encoding="utf-8", compresslevel=3)
+        else:
+            sink = _RawFdWriter(output_path)
+        with sink as f:
+            f.write("{\n")
+            first = True
+            for key, value in registry_dict.items():
+                _stream_section(f, encoder, key, value, first)
+                first = False
+            f.write("\n}")
 
     size_bytes = output_path.stat().st_size
     log.info("JSON export complete. size=%d bytes", size_bytes)
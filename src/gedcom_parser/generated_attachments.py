@@ -70,17 +70,19 @@ def collect_xrefs_from_tree(root: Node) -> List[str]:
     """Collect existing xrefs from pointers AND values like '@S1@' anywhere."""
     found: set[str] = set()
 
-    def walk(n: Node) -> None:
+    # Explicit stack instead of recursion: no per-node call frame and no
+    # RecursionError on pathologically deep trees. Order doesn't matter
+    # here — the result is sorted below.
+    stack: List[Node] = [root]
+    while stack:
+        n = stack.pop()
         if getattr(n, "pointer", None):
             found.add(n.pointer)  # type: ignore[arg-type]
         v = getattr(n, "value", None)
         if isinstance(v, str):
-            for m in _XREF_RE.findall(v):
-                found.add(m)
-        for c in getattr(n, "children", []) or []:
-            walk(c)
+            found.update(_XREF_RE.findall(v))
+        stack.extend(getattr(n, "children", []) or [])
 
-    walk(root)
     return sorted(found)
 
 
@@ -96,8 +98,23 @@ def _child_values(node: Node, tag: str) -> List[str]:
     return out
 
 def _first_child_value(node: Node, tag: str) -> Optional[str]:
-    vals = _child_values(node, tag)
-    return vals[0] if vals else None
+    for c in node.children or []:
+        if c.tag == tag and c.value is not None:
+            return c.value
+    return None
+
+def _index_children(node: Node) -> Dict[str, List[Node]]:
+    """Bucket children by tag in one pass so per-tag pulls are O(1) lookups."""
+    out: Dict[str, List[Node]] = {}
+    setdefault = out.setdefault
+    for c in node.children or []:
+        setdefault(c.tag, []).append(c)
+    return out
+
+# Hoisted once; membership tests against module-level frozensets instead of
+# per-call set literals.
+_PRIM_TRUE = frozenset({"Y", "YES", "TRUE", "1"})
+_PRIM_FALSE = frozenset({"N", "NO", "FALSE", "0"})
 
 def _link_primary_from_obje(node: Node) -> Optional[bool]:
     # Common vendor forms:
@@ -106,40 +123,54 @@ def _link_primary_from_obje(node: Node) -> Optional[bool]:
     v = _first_child_value(node, "_PRIM")
     if not v:
         return None
+    if v == "Y":
+        # Overwhelmingly the value that actually appears; skip the
+        # strip()/upper() allocations for it.
+        return True
     v = v.strip().upper()
-    if v in {"Y", "YES", "TRUE", "1"}:
+    if v in _PRIM_TRUE:
         return True
-    if v in {"N", "NO", "FALSE", "0"}:
+    if v in _PRIM_FALSE:
         return False
     return None
 
 
-def parse_media_object_record(obje_record_node: Node) -> MediaObjectEntity:
-    """Parse a top-level OBJE record node into MediaObjectEntity."""
-    pointer = obje_record_node.pointer or (obje_record_node.value or "")
+def _parse_media_fields(
+    idx: Dict[str, List[Node]],
+) -> Tuple[List[str], Optional[str], Optional[str], Optional[str], Optional[str], List[str]]:
+    """Pull (files, form, title, media_type, mime, notes) from a child index."""
     files: List[str] = []
     form: Optional[str] = None
     title: Optional[str] = None
-    media_type: Optional[str] = None
-    mime: Optional[str] = None
-    notes: List[str] = []
 
-    for c in obje_record_node.children or []:
-        if c.tag == "FILE" and c.value:
+    for c in idx.get("FILE", ()):
+        if c.value:
             files.append(c.value)
             # FORM and TITL can appear under FILE
             form = form or _first_child_value(c, "FORM")
             title = title or _first_child_value(c, "TITL")
-        elif c.tag == "FORM" and c.value:
-            form = form or c.value
-        elif c.tag == "TITL" and c.value:
-            title = title or c.value
-        elif c.tag in {"TYPE", "_TYPE"} and c.value:
-            media_type = media_type or c.value
-        elif c.tag in {"MIME", "_MIME"} and c.value:
-            mime = mime or c.value
-        elif c.tag == "NOTE" and c.value:
-            notes.append(c.value)
+
+    if form is None:
+        form = next((c.value for c in idx.get("FORM", ()) if c.value), None)
+    if title is None:
+        title = next((c.value for c in idx.get("TITL", ()) if c.value), None)
+
+    media_type = next(
+        (c.value for t in ("TYPE", "_TYPE") for c in idx.get(t, ()) if c.value), None
+    )
+    mime = next(
+        (c.value for t in ("MIME", "_MIME") for c in idx.get(t, ()) if c.value), None
+    )
+    notes = [c.value for c in idx.get("NOTE", ()) if c.value]
+
+    return files, form, title, media_type, mime, notes
+
+
+def parse_media_object_record(obje_record_node: Node) -> MediaObjectEntity:
+    """Parse a top-level OBJE record node into MediaObjectEntity."""
+    pointer = obje_record_node.pointer or (obje_record_node.value or "")
+    idx = _index_children(obje_record_node)
+    files, form, title, media_type, mime, notes = _parse_media_fields(idx)
 
     return MediaObjectEntity(
         pointer=pointer,
@@ -157,8 +188,11 @@ def parse_media_object_record(obje_record_node: Node) -> MediaObjectEntity:
 # Promotion + extraction
 # ==============================================================================
 
+# Allows surrounding whitespace so callers don't need a .strip() copy first.
+_XREF_FULLMATCH = re.compile(r"\s*@[^@\s]+@\s*").fullmatch
+
 def _is_pointer_xref(value: Optional[str]) -> bool:
-    return isinstance(value, str) and bool(_XREF_RE.fullmatch(value.strip()))
+    return isinstance(value, str) and _XREF_FULLMATCH(value) is not None
 
 def _obje_is_inline(node: Node) -> bool:
     # Inline OBJE has no pointer-value xref but *does* have children like FILE.
@@ -180,15 +214,12 @@ def promote_inline_obje(
     """Promote inline OBJE to a top-level MediaObjectEntity, return new media xref."""
 
     # Build a synthetic OBJE record node view using the inline node's children.
-    # We treat FILE/FORM/TITL/TYPE/MIME/NOTE as record-level; _PRIM stays link-level.
-    record_like_children: List[Node] = []
-    link_children: List[Node] = []
-
-    for c in obje_link_node.children or []:
-        if c.tag in {"_PRIM"}:
-            link_children.append(c)
-        else:
-            record_like_children.append(c)
+    # We treat FILE/FORM/TITL/TYPE/MIME/NOTE as record-level; _PRIM stays
+    # link-level. Two comprehensions beat one append-loop here: LIST_APPEND
+    # is fused into the comprehension bytecode, and the lists are short.
+    src = obje_link_node.children or []
+    link_children: List[Node] = [c for c in src if c.tag == "_PRIM"]
+    record_like_children: List[Node] = [c for c in src if c.tag != "_PRIM"]
 
     new_xref = xref_factory.new()
     media_entity = _parse_inline_media(new_xref, record_like_children, lineno=getattr(obje_link_node, "lineno", None))
@@ -209,29 +240,12 @@ def promote_inline_obje(
 
 
 def _parse_inline_media(new_xref: str, children: List[Node], lineno: Optional[int]) -> MediaObjectEntity:
-    # Similar to parse_media_object_record, but we only have the child list.
-    files: List[str] = []
-    form: Optional[str] = None
-    title: Optional[str] = None
-    media_type: Optional[str] = None
-    mime: Optional[str] = None
-    notes: List[str] = []
-
+    # Same fields as parse_media_object_record, but we only have the child list.
+    idx: Dict[str, List[Node]] = {}
+    setdefault = idx.setdefault
     for c in children or []:
-        if c.tag == "FILE" and c.value:
-            files.append(c.value)
-            form = form or _first_child_value(c, "FORM")
-            title = title or _first_child_value(c, "TITL")
-        elif c.tag == "FORM" and c.value:
-            form = form or c.value
-        elif c.tag == "TITL" and c.value:
-            title = title or c.value
-        elif c.tag in {"TYPE", "_TYPE"} and c.value:
-            media_type = media_type or c.value
-        elif c.tag in {"MIME", "_MIME"} and c.value:
-            mime = mime or c.value
-        elif c.tag == "NOTE" and c.value:
-            notes.append(c.value)
+        setdefault(c.tag, []).append(c)
+    files, form, title, media_type, mime, notes = _parse_media_fields(idx)
 
     return MediaObjectEntity(
         pointer=new_xref,
@@ -245,6 +259,27 @@ def _parse_inline_media(new_xref: str, children: List[Node], lineno: Optional[in
     )
 
 
+def _nodes_with_obje_below(root: Node) -> set:
+    """ids of nodes whose subtree (self included) contains an OBJE.
+
+    One cheap pre-scan lets the extraction walk skip barren branches
+    entirely — most INDI subtrees (names, events, notes) carry no media,
+    so neither their path tuples nor their stack frames are built.
+    """
+    order: List[Node] = []
+    stack: List[Node] = [root]
+    while stack:
+        n = stack.pop()
+        order.append(n)
+        stack.extend(n.children or [])
+
+    marked: set = set()
+    for n in reversed(order):  # children before parents
+        if n.tag == "OBJE" or any(id(c) in marked for c in (n.children or [])):
+            marked.add(id(n))
+    return marked
+
+
 def extract_attachments(
     entity_root: Node,
     registry: GedcomRegistry,
@@ -259,7 +294,17 @@ def extract_attachments(
     """
     attachments: List[AttachedRecord] = []
 
-    def walk(n: Node, path: Tuple[str, ...]) -> None:
+    has_obje = _nodes_with_obje_below(entity_root)
+    if not has_obje:
+        return attachments
+
+    # Iterative DFS with (node, path) frames: avoids closure-call overhead
+    # per node and recursion limits. Children are pushed in reverse so the
+    # attachment order matches the recursive (document) order.
+    stack: List[Tuple[Node, Tuple[str, ...]]] = [(entity_root, tuple())]
+    while stack:
+        n, path = stack.pop()
+
         # We don't include the OBJE tag itself in the context; instead we attach it to its parent path.
         if n.tag == "OBJE":
             promoted = False
@@ -279,16 +324,14 @@ def extract_attachments(
                         link_raw={c.tag: c.value for c in (n.children or []) if c.tag != "_PRIM"},
                     )
                 )
-            return
-
-        for c in n.children or []:
-            # Context path rules:
-            # - At the entity root, we don't include INDI/FAM/SOUR itself.
-            # - For nested structures, we include their tag (e.g., BIRT, EVEN).
-            next_path = path
-            if n is not entity_root:
-                next_path = path + (n.tag,)
-            walk(c, next_path)
-
-    walk(entity_root, tuple())
+            continue
+
+        # Context path rules:
+        # - At the entity root, we don't include INDI/FAM/SOUR itself.
+        # - For nested structures, we include their tag (e.g., BIRT, EVEN).
+        next_path = path if n is entity_root else path + (n.tag,)
+        for c in reversed(n.children or []):
+            if id(c) in has_obje:
+                stack.append((c, next_path))
+
     return attachments
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 
@@ -10,9 +12,34 @@ from typing import Any, Dict, Optional
 # Core deterministic hashing
 # -----------------------------
 
+# Hash selection. SHA1 stays the default so UUIDs remain stable across
+# releases; GEDCOM_UUID_HASH=blake2 opts into BLAKE2b-128, which is faster
+# on hosts whose OpenSSL lacks SHA-NI acceleration. Both algorithms are
+# hashlib-guaranteed, so either choice is deterministic on every machine —
+# third-party hashes (blake3 etc.) are deliberately not offered because
+# identity must never depend on which optional packages are installed.
+if os.environ.get("GEDCOM_UUID_HASH", "sha1").lower() == "blake2":
+    def _new_hash(data: bytes = b""):
+        return hashlib.blake2b(data, digest_size=16)
+else:
+    def _new_hash(data: bytes = b""):
+        # usedforsecurity=False documents the non-cryptographic use and
+        # keeps SHA1 available under FIPS-restricted OpenSSL.
+        return hashlib.sha1(data, usedforsecurity=False)
+
+
 def _stable_hash(key: str) -> str:
-    # Deterministic stable hashing; SHA1 is fine for identity/fingerprints (not security).
-    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+    # Deterministic stable hashing for identity/fingerprints (not security).
+    return _new_hash(key.encode("utf-8")).hexdigest()
+
+
+# Plain dict rather than lru_cache: for a single-string-argument helper on
+# the identity hot path, a direct get/setitem skips the argument-tuple
+# boxing and LRU bookkeeping each call. Cleared wholesale if it ever grows
+# past the bound (pathological inputs only); eviction order doesn't matter
+# because entries are pure functions of the key.
+_UUID_KEY_CACHE: Dict[str, str] = {}
+_UUID_KEY_CACHE_MAX = 1_000_000
 
 
 def _uuid_from_key(key: str) -> str:
@@ -20,8 +47,35 @@ def _uuid_from_key(key: str) -> str:
     Convert an arbitrary key string into a canonical UUID-like value (8-4-4-4-12)
     based on SHA1. Deterministic for the same key.
     """
-    h = _stable_hash(key)
-    h32 = h[:32]
+    u = _UUID_KEY_CACHE.get(key)
+    if u is None:
+        h32 = _stable_hash(key)[:32]
+        u = f"{h32[0:8]}-{h32[8:12]}-{h32[12:16]}-{h32[16:20]}-{h32[20:32]}"
+        if len(_UUID_KEY_CACHE) >= _UUID_KEY_CACHE_MAX:
+            _UUID_KEY_CACHE.clear()
+        _UUID_KEY_CACHE[key] = u
+    return u
+
+
+def _uuid_from_parts(*parts: object) -> str:
+    """
+    Deterministic UUID from a flat sequence of parts.
+
+    Feeds the hash directly instead of routing the payload through
+    json.dumps(sort_keys=True) — the JSON encoder was only ever used to
+    get a stable byte string. Field positions are fixed by the caller, a
+    separator byte keeps adjacent parts from running together, and None
+    is encoded distinctly from the empty string.
+    """
+    h = _new_hash()
+    update = h.update
+    for p in parts:
+        if p is None:
+            update(b"\x1f\x00")
+        else:
+            update(b"\x1f")
+            update(str(p).encode("utf-8"))
+    h32 = h.hexdigest()[:32]
     return f"{h32[0:8]}-{h32[8:12]}-{h32[12:16]}-{h32[16:20]}-{h32[20:32]}"
 
 
@@ -37,12 +91,16 @@ def deterministic_uuid(*parts: object) -> str:
 # Pointer normalization
 # -----------------------------
 
+@lru_cache(maxsize=100_000)
 def normalize_pointer(pointer: Optional[str]) -> Optional[str]:
     """
     Normalize GEDCOM pointer:
       - strip whitespace
       - uppercase
       - ensure wrapped in @...@
+
+    Cached: the linker resolves every FAMS/FAMC/CHIL edge through this,
+    and each @Xn@ pointer recurs once per reference.
     """
     if pointer is None:
         return None
@@ -64,7 +122,10 @@ def normalize_pointer(pointer: Optional[str]) -> Optional[str]:
     return p
 
 
+@lru_cache(maxsize=100_000)
 def uuid_for_pointer(pointer: str) -> str:
+    # The exporter and linker re-request the same pointers constantly; a
+    # cache hit is a dict lookup instead of normalize + SHA1 + format.
     p = normalize_pointer(pointer)
     if p is None:
         raise ValueError(f"Invalid pointer: {pointer!r}")
@@ -89,26 +150,20 @@ def uuid_for_record(record_node: Dict[str, Any]) -> str:
     children = record_node.get("children") or []
     child_fps = []
     for c in children:
-        ctag = (c.get("tag") or "UNK").upper()
-        cval = c.get("value")
-        child_fps.append(f"{ctag}:{'' if cval is None else str(cval)}")
-
-    payload = {
-        "tag": tag,
-        "value": value,
-        "lineno": lineno,
-        "pointer": pointer,
-        "children": child_fps,
-    }
-
-    key = "REC|" + json.dumps(payload, sort_keys=True, default=str)
-    return _uuid_from_key(key)
+        # tag and value go in as separate parts — the separator byte in
+        # _uuid_from_parts keeps them distinct without building a
+        # "TAG:value" string per child.
+        child_fps.append((c.get("tag") or "UNK").upper())
+        child_fps.append(c.get("value"))
+
+    return _uuid_from_parts("REC", tag, value, lineno, pointer, *child_fps)
 
 
 # -----------------------------
 # Sub-identities used by tests
 # -----------------------------
 
+@lru_cache(maxsize=100_000)
 def uuid_for_name(record_uuid: str, full_name: str) -> str:
     """
     Deterministic identity for a NameRecord attached to an entity.
@@ -116,6 +171,7 @@ def uuid_for_name(record_uuid: str, full_name: str) -> str:
     return _uuid_from_key(f"NAME|{record_uuid}|{(full_name or '').strip()}")
 
 
+@lru_cache(maxsize=100_000)
 def uuid_for_event(
     record_uuid: str,
     tag: str,
@@ -139,7 +195,21 @@ def uuid_for_occupation(record_uuid: str, occ: Any) -> str:
     if isinstance(occ, str):
         payload = occ.strip()
     elif isinstance(occ, dict):
-        payload = json.dumps(occ, sort_keys=True, default=str)
+        # Canonical key without the JSON encoder: occupation blocks are
+        # shallow, so sorted key/value pairs with separator bytes are
+        # enough. Flat lists join directly; anything deeper (rare) still
+        # goes through json for a stable form.
+        parts = []
+        for k in sorted(occ):
+            v = occ[k]
+            if isinstance(v, list) and not any(
+                isinstance(x, (dict, list)) for x in v
+            ):
+                v = "\x1d".join(map(str, v))
+            elif isinstance(v, (dict, list)):
+                v = json.dumps(v, sort_keys=True, default=str)
+            parts.append(f"{k}\x1e{v}")
+        payload = "\x1f".join(parts)
     else:
         payload = str(occ)
     return _uuid_from_key(f"OCCU|{record_uuid}|{payload}")
@@ -156,15 +226,7 @@ def uuid_for_inline_media(
     """
     Deterministic identity for promoted inline OBJE media objects.
     """
-    payload = {
-        "owner_uuid": owner_uuid,
-        "owner_pointer": owner_pointer,
-        "lineno": lineno,
-        "file": file,
-        "title": title,
-    }
-    key = "IMEDIA|" + json.dumps(payload, sort_keys=True, default=str)
-    return _uuid_from_key(key)
+    return _uuid_from_parts("IMEDIA", owner_uuid, owner_pointer, lineno, file, title)
 
 
 __all__ = [
@@ -16,16 +16,16 @@ Intended usage from other parts of the project and tests:
         segment_lines,
         segment_records,
         build_tree,
+        stream_records,
         reconstruct_values,
     )
 """
 
 from __future__ import annotations
-from .value_reconstructor import reconstruct_values
 from .tokenizer import Token, GedcomSyntaxError, tokenize_file, tokenize_line
 from .segmenter import GEDCOMNode, GEDCOMStructureError, segment_lines, segment_records
-from .tree_builder import GEDCOMTree, build_tree
-from .value_reconstructor import reconstruct_values  # assuming this already exists
+from .tree_builder import GEDCOMTree, build_tree, stream_records
+from .value_reconstructor import reconstruct_values
 
 
 __all__ = [
@@ -39,5 +39,6 @@ __all__ = [
     "segment_lines",
     "segment_records",
     "build_tree",
+    "stream_records",
     "reconstruct_values",
 ]
@@ -1,11 +1,17 @@
 import os
-from rich import print as rprint
+
+from gedcom_parser.logger import get_logger
+
+log = get_logger("file_loader")
+
 
 def load_file(path: str):
     if not os.path.exists(path):
         raise FileNotFoundError(f"File not found: {path}")
 
-    rprint(f"[green][INFO][/green] Loaded file: {path}")
+    # Lazy %s formatting through the logger; the old rich.print spun up a
+    # Console (terminal probing, markup parsing) on every call.
+    log.debug("Loaded file: %s", path)
 
     with open(path, "r", encoding="utf-8", errors="replace") as f:
         return f.read()
@@ -5,7 +5,7 @@ Resolves absolute, validated paths to input GEDCOM/JSON files.
 """
 
 import os
-from rich import print as rprint
+import stat
 from gedcom_parser.logger import log_debug, log_error
 
 
@@ -21,15 +21,19 @@ def resolve_input_path(path: str | None) -> str | None:
         return None
 
     abs_path = os.path.abspath(path)
-    log_debug(f"Resolving input file: {abs_path}")
-
-    if not os.path.exists(abs_path):
-        log_error(f"Input file does not exist: {abs_path}")
-        raise FileNotFoundError(f"Input file not found: {abs_path}")
-
-    if not os.path.isfile(abs_path):
-        log_error(f"Input path is not a file: {abs_path}")
+    log_debug("Resolving input file: %s", abs_path)
+
+    # One stat syscall covers both checks (exists + regular file) instead
+    # of the separate os.path.exists / os.path.isfile round-trips.
+    try:
+        st = os.stat(abs_path)
+    except FileNotFoundError:
+        log_error("Input file does not exist: %s", abs_path)
+        raise FileNotFoundError(f"Input file not found: {abs_path}") from None
+
+    if not stat.S_ISREG(st.st_mode):
+        log_error("Input path is not a file: %s", abs_path)
         raise ValueError(f"Input path is not a file: {abs_path}")
 
-    log_debug(f"Validated input file: {abs_path}")
+    log_debug("Validated input file: %s", abs_path)
     return abs_path
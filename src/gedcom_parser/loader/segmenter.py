@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Iterator
+from typing import Iterable, List, Optional, Iterator
 
 from .tokenizer import Token
 
 
-@dataclass
+@dataclass(slots=True)
 class GEDCOMNode:
     """
     A hierarchical GEDCOM tree node produced from a flat token stream.
 
+    slots=True drops the per-instance __dict__ — at one node per GEDCOM
+    line that is a large share of tree memory, and fixed-offset field
+    access speeds up every traversal.
+
     Attributes:
         level: GEDCOM level number (0 for records, >0 for substructures).
         tag: The GEDCOM tag (HEAD, INDI, BIRT, DATE, NOTE, etc.).
@@ -46,10 +50,21 @@ class GEDCOMNode:
         return None
 
     def iter_subtree(self) -> Iterator["GEDCOMNode"]:
-        """Yield this node and all descendants in depth-first order."""
-        yield self
-        for child in self.children:
-            yield from child.iter_subtree()
+        """Yield this node and all descendants in depth-first order.
+
+        Iterative: a recursive `yield from` chain pays one generator frame
+        per tree level for every yielded node and can hit the recursion
+        limit on pathologically deep trees; a single generator with an
+        explicit stack yields the same pre-order.
+        """
+        stack = [self]
+        pop = stack.pop
+        while stack:
+            node = pop()
+            yield node
+            children = node.children
+            if children:
+                stack.extend(reversed(children))
 
     def __repr__(self) -> str:
         ptr = f" {self.pointer}" if self.pointer else ""
@@ -62,9 +77,13 @@ class GEDCOMStructureError(Exception):
     """Raised when hierarchical structure rules are violated."""
 
 
-def segment_lines(tokens: List[Token]) -> List[GEDCOMNode]:
+def segment_lines(tokens: Iterable[Token]) -> List[GEDCOMNode]:
     """
-    Convert a flat list of Tokens into a full hierarchical tree.
+    Convert a flat sequence of Tokens into a full hierarchical tree.
+
+    Accepts any iterable — consumption is strictly sequential, so a
+    generator (e.g. straight from tokenize_file) works without being
+    materialized first.
 
     Rules:
         - Level 0 tokens are roots.
@@ -75,56 +94,55 @@ def segment_lines(tokens: List[Token]) -> List[GEDCOMNode]:
     This function returns ALL nodes, preserving hierarchy.
     Use segment_records() to extract record-level (level 0) nodes only.
     """
-    if not tokens:
-        return []
-
     root_nodes: List[GEDCOMNode] = []
     stack: List[GEDCOMNode] = []  # stack[level] = last node at that level
 
-    for tok in tokens:
+    # Token is a NamedTuple, so unpacking it positionally reads the fields
+    # in one C-level operation instead of five attribute lookups per line.
+    for lineno, level, pointer, tag, value, _raw in tokens:
         node = GEDCOMNode(
-            level=tok.level,
-            tag=tok.tag,
-            value=tok.value,
-            pointer=tok.pointer,
-            lineno=tok.lineno,
+            level=level,
+            tag=tag,
+            value=value,
+            pointer=pointer,
+            lineno=lineno,
         )
 
         # Level-0: always a new root
-        if tok.level == 0:
+        if level == 0:
             root_nodes.append(node)
             stack = [node]  # reset stack
             continue
 
         # For non-zero levels:
         # Validate jump constraints (cannot skip levels)
-        if tok.level > len(stack):
+        if level > len(stack):
             raise GEDCOMStructureError(
-                f"Line {tok.lineno}: Level jumped from {len(stack)-1} to {tok.level} without intermediate parent"
+                f"Line {lineno}: Level jumped from {len(stack)-1} to {level} without intermediate parent"
             )
 
         # Pop the stack down to parent level
-        parent_level = tok.level - 1
-        stack = stack[: tok.level]
+        parent_level = level - 1
+        stack = stack[:level]
 
         if parent_level < 0 or parent_level >= len(stack):
             raise GEDCOMStructureError(
-                f"Line {tok.lineno}: No valid parent for level {tok.level}"
+                f"Line {lineno}: No valid parent for level {level}"
             )
 
         parent = stack[parent_level]
-        parent.add_child(node)
+        parent.children.append(node)
 
         # Push node to stack
-        if tok.level == len(stack):
+        if level == len(stack):
             stack.append(node)
         else:
-            stack[tok.level] = node
+            stack[level] = node
 
     return root_nodes
 
 
-def segment_records(tokens: List[Token]) -> List[GEDCOMNode]:
+def segment_records(tokens: Iterable[Token]) -> List[GEDCOMNode]:
     """
     Convenience wrapper: build the tree and return only level-0 nodes.
     """
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+import sys
 from pathlib import Path
-from typing import Iterator, Optional, Union
+from typing import Iterator, NamedTuple, Optional, Union
 
 
-@dataclass(frozen=True)
-class Token:
+class Token(NamedTuple):
     """
     A single GEDCOM line token.
 
+    A NamedTuple rather than a dataclass: one of these is built per input
+    line, and tuple construction is a single C call with no __init__
+    frame, which matters at millions of lines. Immutability and
+    name-based field access are preserved.
+
     Attributes:
         lineno: 1-based line number in the original file.
         level: Parsed GEDCOM level (0, 1, 2, ...).
@@ -132,17 +137,49 @@ def tokenize_line(line: str, lineno: int = 0) -> Token:
         lineno=lineno,
         level=level,
         pointer=pointer,
-        tag=tag,
+        tag=sys.intern(tag),
         value=value,
         raw=raw,
     )
 
 
+# Whole-file fast path: one finditer call lets the C regex engine loop over
+# all well-formed lines instead of crossing the Python/C boundary per line.
+# The pattern mirrors tokenize_line's grammar — level, optional pointer, tag,
+# optional value (tags never start with '@'; a leading '@' means pointer).
+# Anything it rejects falls back to tokenize_line, which either produces the
+# token or raises the precise GedcomSyntaxError.
+#
+# Quantifiers are possessive (Python 3.11+): each run is terminated by a
+# character its class excludes, so giving positions back can never produce
+# a match — declaring that lets the engine fail malformed lines without
+# backtracking through them.
+_LINE_RE = re.compile(
+    r"^(?P<level>\d++) ++"
+    r"(?:(?P<pointer>@[^ \n]++) ++)?"
+    r"(?P<tag>[^@ \n][^ \n]*+)"
+    r"(?: (?P<value>.*+))?$",
+    re.MULTILINE,
+)
+
+
+def _tokenize_slow_lines(chunk: str, first_lineno: int) -> Iterator[Token]:
+    """Tokenize a stretch of text the fast-path pattern skipped."""
+    for offset, line in enumerate(chunk.split("\n")):
+        stripped = _strip_eol(line)
+        if not stripped.strip():
+            # Skip truly blank lines; they are not meaningful in GEDCOM.
+            continue
+        yield tokenize_line(stripped, lineno=first_lineno + offset)
+
+
 def tokenize_file(path: Union[str, Path]) -> Iterator[Token]:
     """
     Yield Token objects for every non-empty GEDCOM line in the given file.
 
-    This is a thin wrapper around tokenize_line() which adds line numbers.
+    Well-formed lines are matched in bulk by a single multiline finditer
+    pass; odd lines go through tokenize_line() so error messages (and the
+    few exotic-but-legal shapes) stay identical to per-line parsing.
 
     Args:
         path: Path to the GEDCOM file.
@@ -159,12 +196,34 @@ def tokenize_file(path: Union[str, Path]) -> Iterator[Token]:
     if not file_path.is_file():
         raise FileNotFoundError(f"GEDCOM file not found: {file_path}")
 
-    with file_path.open("r", encoding="utf-8", errors="replace") as f:
-        for lineno, raw_line in enumerate(f, start=1):
-            stripped = _strip_eol(raw_line)
-
-            if not stripped.strip():
-                # Skip truly blank lines; they are not meaningful in GEDCOM.
-                continue
+    text = file_path.read_text(encoding="utf-8", errors="replace")
+    if text.startswith("\ufeff"):
+        text = text[1:]
+
+    pos = 0
+    lineno = 1
+    intern = sys.intern
+    for m in _LINE_RE.finditer(text):
+        start = m.start()
+        if start > pos:
+            gap = text[pos:start]
+            yield from _tokenize_slow_lines(gap, lineno)
+            lineno += gap.count("\n")
+
+        raw = m.group(0)
+        # Tags form a tiny vocabulary (INDI, NAME, DATE, ...); interning
+        # collapses the per-line tag strings to shared objects, so the
+        # segmenter's and builders' tag comparisons become pointer checks.
+        yield Token(
+            lineno=lineno,
+            level=int(m.group("level")),
+            pointer=m.group("pointer"),
+            tag=intern(m.group("tag")),
+            value=m.group("value") or "",
+            raw=raw,
+        )
+        pos = m.end() + 1  # step over the newline
+        lineno += 1
 
-            yield tokenize_line(stripped, lineno=lineno)
+    if pos < len(text):
+        yield from _tokenize_slow_lines(text[pos:], lineno)
@@ -5,8 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, Iterator, List, Optional
 
-from .tokenizer import Token
-from .segmenter import GEDCOMNode, segment_records
+from pathlib import Path
+from typing import Union
+
+from .tokenizer import Token, tokenize_file
+from .segmenter import GEDCOMNode, GEDCOMStructureError, segment_records
+from .value_reconstructor import reconstruct_values
 
 
 @dataclass
@@ -29,10 +33,13 @@ class GEDCOMTree:
     _pointer_index: Dict[str, GEDCOMNode] = field(
         default_factory=dict, init=False, repr=False
     )
-    _tag_index: Dict[str, List[GEDCOMNode]] = field(
+    _record_tag_index: Dict[str, List[GEDCOMNode]] = field(
         default_factory=dict, init=False, repr=False
     )
     _indexes_built: bool = field(default=False, init=False, repr=False)
+    _all_tags_sorted: Optional[List[str]] = field(
+        default=None, init=False, repr=False
+    )
 
     # ------------------------------------------------------------------ #
     # Core helpers
@@ -48,32 +55,73 @@ class GEDCOMTree:
         """
         Iterate over every node in the tree (depth-first), including roots
         and all descendants.
+
+        One explicit stack for the whole tree: `yield from
+        root.iter_subtree()` spun up a generator per root and resumed two
+        frames per node, which is pure overhead for full-tree consumers.
+        Same pre-order as before.
         """
-        for root in self.records:
-            yield from root.iter_subtree()
+        stack = self.records[::-1]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            yield node
+            children = node.children
+            if children:
+                extend(reversed(children))
 
     # ------------------------------------------------------------------ #
     # Index construction
     # ------------------------------------------------------------------ #
 
     def _build_indexes(self) -> None:
-        """Build pointer and tag indexes from the current records."""
+        """Build pointer and tag indexes from the current records.
+
+        The full walk is only needed for pointers, which can appear at
+        any depth. Tags are bucketed for level-0 records alone — that is
+        all find_records_by_tag and all_tags ever serve — so the
+        per-node work in the loop stays minimal.
+        """
         pointer_index: Dict[str, GEDCOMNode] = {}
-        tag_index: Dict[str, List[GEDCOMNode]] = {}
+        record_tag_index: Dict[str, List[GEDCOMNode]] = {}
+
+        # Inlined DFS with bound locals: iter_nodes() routes every node
+        # through two generator frames, which is pure overhead for a loop
+        # this hot. Reversed pushes keep buckets in document order.
+        stack = self.records[::-1]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
 
-        for node in self.iter_nodes():
             # Pointer index
             if node.pointer:
                 pointer_index[node.pointer] = node
 
-            # Tag index (case-insensitive, store uppercase)
-            tag = (node.tag or "").upper()
-            if not tag:
-                continue
-            tag_index.setdefault(tag, []).append(node)
+            # Record tag index (case-insensitive, store uppercase):
+            # level-0 only, since no query API exposes deeper tags.
+            if node.level == 0:
+                tag = node.tag
+                if tag:
+                    if not tag.isupper():
+                        tag = tag.upper()
+                    # Two-path get-or-insert: with ~50 distinct tags
+                    # nearly every record is a hit, and this avoids the
+                    # empty list() allocation (setdefault) or __missing__
+                    # dispatch (defaultdict) on that dominant path.
+                    bucket = record_tag_index.get(tag)
+                    if bucket is None:
+                        record_tag_index[tag] = [node]
+                    else:
+                        bucket.append(node)
+
+            children = node.children
+            if children:
+                extend(reversed(children))
 
         self._pointer_index = pointer_index
-        self._tag_index = tag_index
+        self._record_tag_index = record_tag_index
         self._indexes_built = True
 
     def _ensure_indexes(self) -> None:
@@ -112,16 +160,21 @@ class GEDCOMTree:
         if not tag:
             return []
         self._ensure_indexes()
-        t = tag.upper()
-        candidates = self._tag_index.get(t, [])
-        return [n for n in candidates if n.level == 0]
+        # Copy so callers can mutate their result without touching the index.
+        return list(self._record_tag_index.get(tag.upper(), ()))
 
     def all_tags(self) -> List[str]:
         """
-        Return a list of distinct tags found among level-0 records.
+        Return a sorted list of distinct tags found among level-0 records.
+
+        Derived from the record tag index (so tags come back uppercase)
+        and cached after the first call instead of re-scanning records.
         """
-        tags = {rec.tag for rec in self.records if rec.tag}
-        return sorted(tags)
+        self._ensure_indexes()
+        if self._all_tags_sorted is None:
+            self._all_tags_sorted = sorted(self._record_tag_index)
+        # Copy so callers can mutate their result without touching the cache.
+        return list(self._all_tags_sorted)
 
     def __repr__(self) -> str:  # pragma: no cover - cosmetic
         return f"<GEDCOMTree records={len(self.records)}>"
@@ -138,9 +191,68 @@ def build_tree(tokens: Iterable[Token]) -> GEDCOMTree:
     Downstream components (value reconstruction, entity extraction, etc.)
     should operate on this tree.
     """
-    # We materialize tokens into a list because segment_records needs
-    # random access to levels. For very large files, a streaming variant
-    # could be introduced later.
-    token_list = list(tokens)
-    records = segment_records(token_list)
+    # Tokens are consumed strictly in order, so the stream feeds the
+    # segmenter directly — no intermediate token list doubling peak
+    # memory on large files.
+    records = segment_records(tokens)
     return GEDCOMTree(records=records)
+
+
+def stream_records(path: Union[str, Path]) -> Iterator[GEDCOMNode]:
+    """
+    Stream fully-built, value-reconstructed level-0 records from a file.
+
+    Fuses tokenize → segment → CONC/CONT reconstruction into one pass:
+    each root is yielded (with values merged and CONC/CONT children
+    removed) the moment the next level-0 line arrives, so peak memory is
+    one record's subtree instead of the whole token list plus the whole
+    tree. Callers that want everything at once can still do
+    ``GEDCOMTree(records=list(stream_records(path)))``.
+
+    Raises:
+        GEDCOMStructureError: on the same level-jump violations as
+            segment_lines.
+    """
+    root: Optional[GEDCOMNode] = None
+    stack: List[GEDCOMNode] = []
+
+    for lineno, level, pointer, tag, value, _raw in tokenize_file(path):
+        node = GEDCOMNode(
+            level=level,
+            tag=tag,
+            value=value,
+            pointer=pointer,
+            lineno=lineno,
+        )
+
+        if level == 0:
+            if root is not None:
+                reconstruct_values([root])
+                yield root
+            root = node
+            stack = [node]
+            continue
+
+        if level > len(stack):
+            raise GEDCOMStructureError(
+                f"Line {lineno}: Level jumped from {len(stack)-1} to {level} without intermediate parent"
+            )
+
+        parent_level = level - 1
+        stack = stack[:level]
+
+        if parent_level < 0 or parent_level >= len(stack):
+            raise GEDCOMStructureError(
+                f"Line {lineno}: No valid parent for level {level}"
+            )
+
+        stack[parent_level].children.append(node)
+
+        if level == len(stack):
+            stack.append(node)
+        else:
+            stack[level] = node
+
+    if root is not None:
+        reconstruct_values([root])
+        yield root
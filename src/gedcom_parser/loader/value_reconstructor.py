@@ -31,39 +31,83 @@ from .segmenter import GEDCOMNode
 
 def _reconstruct_node(node: GEDCOMNode) -> None:
     """
-    Recursively reconstruct values for this node and its children.
-    Mutates the node in place.
+    Reconstruct values for this node and its children.
+    Mutates the nodes in place.
+
+    Iterative: an explicit work stack replaces recursion, so deep
+    NOTE/CONT chains cost no Python call frames and cannot hit the
+    recursion limit. Each node is independent once its own CONC/CONT
+    children are folded in, so visit order doesn't matter.
 
     After reconstruction:
       - Parent.value has the final reconstructed text
       - CONC and CONT child nodes are removed
       - Other children remain and are also processed
     """
+    stack: List[GEDCOMNode] = [node]
+    pop = stack.pop
+    while stack:
+        _merge_continuations(pop(), stack)
+
+
+def _has_continuation(children: List[GEDCOMNode]) -> bool:
+    """True if any child is a CONC/CONT node (case-insensitive)."""
+    for child in children:
+        tag = child.tag
+        if tag == "CONC" or tag == "CONT":
+            return True
+        if tag and not tag.isupper():
+            tag = tag.upper()
+            if tag == "CONC" or tag == "CONT":
+                return True
+    return False
+
+
+def _merge_continuations(node: GEDCOMNode, stack: List[GEDCOMNode]) -> None:
+    """Fold this node's CONC/CONT children into its value; queue the rest."""
+    children = node.children
+
+    # Fast path: the vast majority of parents carry no continuations at
+    # all, so one read-only scan saves rebuilding node.value, allocating
+    # a replacement child list, and reassigning both.
+    if not _has_continuation(children):
+        stack.extend(children)
+        return
+
     new_children: List[GEDCOMNode] = []
-    base_value = node.value or ""
+    # Collect fragments and join once: repeated `base_value += ...` would
+    # re-copy the whole growing string per CONC/CONT line, going quadratic
+    # on long NOTE blocks.
+    parts: List[str] = [node.value] if node.value else []
 
     for child in node.children:
-        tag = (child.tag or "").upper()
+        tag = child.tag
+
+        if tag != "CONC" and tag != "CONT":
+            # Tags are uppercase in valid files, so the exact compares
+            # above are the whole test; only a non-uppercase tag can
+            # still be a continuation in disguise. isupper() is an
+            # allocation-free scan, unlike calling .upper() per child.
+            if tag and not tag.isupper():
+                tag = tag.upper()
+            if tag != "CONC" and tag != "CONT":
+                # Normal GEDCOM child; queue it for its own merge pass
+                new_children.append(child)
+                continue
 
         if tag == "CONC":
             # Append directly (no newline)
             if child.value:
-                base_value += child.value
-
-        elif tag == "CONT":
-            # Append newline + child text
-            base_value += "\n"
+                parts.append(child.value)
+        else:  # CONT: append newline + child text
+            parts.append("\n")
             if child.value:
-                base_value += child.value
-
-        else:
-            # Normal GEDCOM child; recurse into it
-            _reconstruct_node(child)
-            new_children.append(child)
+                parts.append(child.value)
 
     # Apply the reconstructed value
-    node.value = base_value
+    node.value = "".join(parts)
     node.children = new_children
+    stack.extend(new_children)
 
 
 def reconstruct_values(records: List[GEDCOMNode]) -> List[GEDCOMNode]:
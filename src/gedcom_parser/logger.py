@@ -14,7 +14,6 @@ from __future__ import annotations
 import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Optional
 
 from gedcom_parser.config import get_config
 
@@ -24,7 +23,34 @@ from gedcom_parser.config import get_config
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 LOG_DIR = PROJECT_ROOT / "logs"
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+# mkdir(exist_ok=True) still costs a syscall per call, so the directory
+# is created lazily — on the first handler build, not at import — and a
+# flag makes every later check a plain global read.
+_log_dir_ready = False
+
+
+def _ensure_log_dir() -> None:
+    global _log_dir_ready
+    if _log_dir_ready:
+        return
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    _log_dir_ready = True
+
+BASE_LOGGER_NAME = "gedcom_parser"
+
+# Config memoized at first use. get_config() itself caches the parsed
+# YAML, but every get_logger() call still paid a cross-module call plus
+# global lookup for a value that never changes; a module-local global
+# makes the repeat cost a single name load.
+_cfg = None
+
+
+def _cfg_cached():
+    global _cfg
+    if _cfg is None:
+        _cfg = get_config()
+    return _cfg
 
 
 # =====================================================================
@@ -32,6 +58,7 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 # =====================================================================
 
 def _build_rotating_handler(log_path: Path, level: int) -> RotatingFileHandler:
+    _ensure_log_dir()
     handler = RotatingFileHandler(
         log_path,
         maxBytes=5 * 1024 * 1024,   # 5MB
@@ -48,6 +75,49 @@ def _build_rotating_handler(log_path: Path, level: int) -> RotatingFileHandler:
     return handler
 
 
+# =====================================================================
+# BASE LOGGER (master log + console, configured once)
+# =====================================================================
+
+def _configure_base_logger() -> logging.Logger:
+    """
+    Attach the master-log and console handlers once, on the package base
+    logger. Module loggers propagate their records here, so each record
+    is formatted for the master log and console exactly once — instead of
+    every module logger carrying its own copies of both handlers, which
+    tripled per-record work and cost two extra file descriptors per
+    module.
+    """
+    base = logging.getLogger(BASE_LOGGER_NAME)
+    if base.handlers:
+        return base
+
+    cfg = _cfg_cached()
+    level = logging.DEBUG if cfg.debug else logging.INFO
+
+    base.setLevel(level)
+    base.propagate = False  # Don't leak into the stdlib root logger
+
+    # ------------------------------------------
+    # File: master log (gedcom_parser.log)
+    # ------------------------------------------
+    base.addHandler(
+        _build_rotating_handler(LOG_DIR / "gedcom_parser.log", level)
+    )
+
+    # ------------------------------------------
+    # Console handler (INFO+ only)
+    # ------------------------------------------
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    console.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    )
+    base.addHandler(console)
+
+    return base
+
+
 # =====================================================================
 # LOGGER FACTORY
 # =====================================================================
@@ -58,51 +128,65 @@ def get_logger(name: str) -> logging.Logger:
     """
     Provides a logger for each module.
 
-    - Always logs to the master log: gedcom_parser.log
-    - Always logs to a module-specific log: <name>.log
-    - Logs to console (INFO/ERROR)
+    - Logs to a module-specific log: <name>.log
+    - Master log + console output arrive via propagation to the
+      "gedcom_parser" base logger
     - DEBUG output only appears if config.debug = True
     """
 
     if name in _LOGGER_CACHE:
         return _LOGGER_CACHE[name]
 
-    cfg = get_config()
-    debug_enabled = bool(cfg.debug)
+    _configure_base_logger()
 
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG if debug_enabled else logging.INFO)
-    logger.propagate = False  # Prevent duplicate console logs
+    cfg = _cfg_cached()
+    level = logging.DEBUG if cfg.debug else logging.INFO
+
+    # Child of the base logger so records propagate to the shared
+    # master-log and console handlers.
+    logger = logging.getLogger(f"{BASE_LOGGER_NAME}.{name}")
+    logger.setLevel(level)
+    logger.propagate = True
 
     # ------------------------------------------
     # File: module log
     # ------------------------------------------
-    module_log_file = LOG_DIR / f"{name}.log"
-    module_handler = _build_rotating_handler(
-        module_log_file,
-        logging.DEBUG if debug_enabled else logging.INFO
-    )
+    module_handler = _build_rotating_handler(LOG_DIR / f"{name}.log", level)
     logger.addHandler(module_handler)
 
-    # ------------------------------------------
-    # File: master log (gedcom_parser.log)
-    # ------------------------------------------
-    master_log_file = LOG_DIR / "gedcom_parser.log"
-    master_handler = _build_rotating_handler(
-        master_log_file,
-        logging.DEBUG if debug_enabled else logging.INFO
-    )
-    logger.addHandler(master_handler)
-
-    # ------------------------------------------
-    # Console handler (INFO+ only)
-    # ------------------------------------------
-    console = logging.StreamHandler()
-    console.setLevel(logging.INFO)
-    console.setFormatter(
-        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-    )
-    logger.addHandler(console)
-
     _LOGGER_CACHE[name] = logger
     return logger
+
+
+# =====================================================================
+# MODULE-LEVEL CONVENIENCE WRAPPERS
+# =====================================================================
+#
+# Each wrapper checks isEnabledFor before handing off, so a disabled
+# level costs one integer compare and nothing else. Callers should pass
+# lazy %s-style arguments — log_debug("parsed %s", path) — rather than
+# f-strings, so expensive argument formatting is also skipped when the
+# level is off.
+
+def log_debug(msg: str, *args, **kwargs) -> None:
+    lg = _configure_base_logger()
+    if lg.isEnabledFor(logging.DEBUG):
+        lg.debug(msg, *args, **kwargs)
+
+
+def log_info(msg: str, *args, **kwargs) -> None:
+    lg = _configure_base_logger()
+    if lg.isEnabledFor(logging.INFO):
+        lg.info(msg, *args, **kwargs)
+
+
+def log_warning(msg: str, *args, **kwargs) -> None:
+    lg = _configure_base_logger()
+    if lg.isEnabledFor(logging.WARNING):
+        lg.warning(msg, *args, **kwargs)
+
+
+def log_error(msg: str, *args, **kwargs) -> None:
+    lg = _configure_base_logger()
+    if lg.isEnabledFor(logging.ERROR):
+        lg.error(msg, *args, **kwargs)
@@ -1,10 +1,14 @@
 """
 Logging package for gedcom_parser.
 
-Exposes get_logger() from logger.py so modules can do:
+Thin compatibility shim: the canonical, config-driven implementation
+lives in gedcom_parser/logger.py (shared handlers via propagation,
+rotating files, debug toggle from config). This package only re-exports
+it so existing imports keep working:
+
     from gedcom_parser.logging import get_logger
 """
 
-from .logger import get_logger
+from gedcom_parser.logger import get_logger
 
 __all__ = ["get_logger"]
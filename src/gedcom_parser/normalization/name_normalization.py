@@ -18,6 +18,11 @@ import argparse
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
+try:  # optional C-accelerated codec; stdlib json remains the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 from gedcom_parser.logger import get_logger
 from gedcom_parser.entities.name_block import parse_name_block
 
@@ -64,6 +69,15 @@ def _ensure_names_list(indi: Dict[str, Any]) -> List[Any]:
     return []
 
 
+_CANONICAL_NAME_KEYS = ("full", "given", "surname", "prefix", "suffix", "nickname", "name_type")
+
+_FILLABLE_NAME_KEYS = (
+    ("given", "filled_given"),
+    ("surname", "filled_surname"),
+    ("suffix", "filled_suffix"),
+)
+
+
 def _patch_name_record_fields(name_rec: Dict[str, Any], nb_dict: Dict[str, Any], counts: Dict[str, int]) -> None:
     """
     Fill missing given/surname/suffix conservatively based on parsed info.
@@ -72,18 +86,27 @@ def _patch_name_record_fields(name_rec: Dict[str, Any], nb_dict: Dict[str, Any],
     parsed = (nb_dict.get("parsed") or {}) if isinstance(nb_dict.get("parsed"), dict) else {}
     normalized = (nb_dict.get("normalized") or {}) if isinstance(nb_dict.get("normalized"), dict) else {}
 
-    # Fill missing components
-    if not _clean_ws(name_rec.get("given")) and _clean_ws(parsed.get("given")):
-        name_rec["given"] = parsed.get("given")
-        counts["filled_given"] += 1
-
-    if not _clean_ws(name_rec.get("surname")) and _clean_ws(parsed.get("surname")):
-        name_rec["surname"] = parsed.get("surname")
-        counts["filled_surname"] += 1
+    # Clean every canonical key exactly once up front; the old flow
+    # cleaned the same value twice per key (fill check + the final
+    # rewrite pass), doubling the split/join allocations per record.
+    cleaned = {key: _clean_ws(name_rec.get(key)) for key in _CANONICAL_NAME_KEYS}
+    present = {key for key in _CANONICAL_NAME_KEYS if key in name_rec}
 
-    if not _clean_ws(name_rec.get("suffix")) and _clean_ws(parsed.get("suffix")):
-        name_rec["suffix"] = parsed.get("suffix")
-        counts["filled_suffix"] += 1
+    # Fill missing components
+    for key, counter in _FILLABLE_NAME_KEYS:
+        if not cleaned[key]:
+            parsed_clean = _clean_ws(parsed.get(key))
+            if key == "surname" and parsed_clean:
+                # parse_name_block peels particles off the surname
+                # ("van der Meer" -> prefix "van der", surname "Meer");
+                # the record's surname field keeps the full form.
+                prefix_clean = _clean_ws(parsed.get("surname_prefix"))
+                if prefix_clean:
+                    parsed_clean = f"{prefix_clean} {parsed_clean}"
+            if parsed_clean:
+                cleaned[key] = parsed_clean
+                present.add(key)
+                counts[counter] += 1
 
     # Add helper fields (non-destructive)
     nf = _clean_ws(normalized.get("full"))
@@ -91,16 +114,30 @@ def _patch_name_record_fields(name_rec: Dict[str, Any], nb_dict: Dict[str, Any],
         name_rec["normalized_full"] = nf
         counts["added_normalized_full"] += 1
 
-    # Always whitespace-clean existing canonical keys
-    for key in ("full", "given", "surname", "prefix", "suffix", "nickname", "name_type"):
-        if key in name_rec:
-            name_rec[key] = _clean_ws(name_rec.get(key))
+    # Write back cleaned canonical keys, skipping values already clean
+    for key in present:
+        val = cleaned[key]
+        if name_rec.get(key) != val:
+            name_rec[key] = val
+
+
+# Registries below this size aren't worth process startup + pickling costs.
+_PARALLEL_THRESHOLD = 5000
+
+
+def _build_block_worker(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one name block dict; module-scope so it pickles for pool workers."""
+    return parse_name_block(**kwargs).to_dict()
 
 
 def normalize_individual_names(root: Dict[str, Any]) -> Dict[str, int]:
     """
     Mutates root in-place (additive/patch-only).
     Returns counters for logging/verification.
+
+    Name-block parsing is pure string work with no shared state between
+    individuals, so on large registries the parse step fans out across a
+    process pool; attachment/patching stays in this process.
     """
     counts: Dict[str, int] = {
         "individuals": 0,
@@ -119,40 +156,55 @@ def normalize_individual_names(root: Dict[str, Any]) -> Dict[str, int]:
     if not isinstance(individuals, dict):
         return counts
 
+    # Local binds for the per-individual loop: global/name lookups happen
+    # once here instead of once per record.
+    clean_ws = _clean_ws
+    best_name_dict = _best_name_dict
+    ensure_names_list = _ensure_names_list
+    patch_fields = _patch_name_record_fields
+
+    # Pass 1: collect parse jobs (pure data, picklable).
+    jobs: List[Tuple[Dict[str, Any], List[Any], Dict[str, Any]]] = []
     for ptr, indi in individuals.items():
         if not isinstance(indi, dict):
             counts["skipped_non_dict_individual"] += 1
             continue
         counts["individuals"] += 1
 
-        names_list = _ensure_names_list(indi)
-        best = _best_name_dict(names_list)
+        names_list = ensure_names_list(indi)
+        best = best_name_dict(names_list)
         if best is None:
             counts["skipped_missing_names"] += 1
             continue
 
-        full = _clean_ws(best.get("full")) or ""
-        given = _clean_ws(best.get("given"))
-        surname = _clean_ws(best.get("surname"))
-        prefix = _clean_ws(best.get("prefix"))
-        suffix = _clean_ws(best.get("suffix"))
-        nickname = _clean_ws(best.get("nickname"))
-        name_type = _clean_ws(best.get("name_type"))
-
         # Preserve any raw metadata if present
         raw_meta = best.get("raw") if isinstance(best.get("raw"), dict) else None
 
-        nb = parse_name_block(
-            raw_full=full,
-            given=given,
-            surname=surname,
-            prefix=prefix,
-            suffix=suffix,
-            nickname=nickname,
-            name_type=name_type,
-            raw_meta=raw_meta,
-        )
-        nb_dict = nb.to_dict()
+        kwargs = {
+            "raw_full": clean_ws(best.get("full")) or "",
+            "given": clean_ws(best.get("given")),
+            "surname": clean_ws(best.get("surname")),
+            "prefix": clean_ws(best.get("prefix")),
+            "suffix": clean_ws(best.get("suffix")),
+            "nickname": clean_ws(best.get("nickname")),
+            "name_type": clean_ws(best.get("name_type")),
+            "raw_meta": raw_meta,
+        }
+        jobs.append((indi, names_list, kwargs))
+
+    # Pass 2: build the blocks, fanning out for large registries.
+    if len(jobs) >= _PARALLEL_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as ex:
+            nb_dicts = list(
+                ex.map(_build_block_worker, (kw for _, _, kw in jobs), chunksize=256)
+            )
+    else:
+        nb_dicts = [_build_block_worker(kw) for _, _, kw in jobs]
+
+    # Pass 3: attach blocks and patch name records in-process.
+    for (indi, names_list, _), nb_dict in zip(jobs, nb_dicts):
         counts["name_blocks"] += 1
 
         # Attach per-individual first-class block
@@ -160,17 +212,13 @@ def normalize_individual_names(root: Dict[str, Any]) -> Dict[str, int]:
             indi["name_block"] = nb_dict
             counts["created_name_block"] += 1
         else:
-            # Update in-place but preserve any custom fields previously added
-            if isinstance(indi.get("name_block"), dict):
-                indi["name_block"] = nb_dict
-            else:
-                indi["name_block"] = nb_dict
+            indi["name_block"] = nb_dict
             counts["updated_name_block"] += 1
 
         # Patch all name dicts in the list (never delete)
         for n in names_list:
             if isinstance(n, dict):
-                _patch_name_record_fields(n, nb_dict, counts)
+                patch_fields(n, nb_dict, counts)
 
     return counts
 
@@ -190,13 +238,25 @@ def main(argv: Optional[List[str]] = None) -> None:
         log.setLevel("DEBUG")
 
     log.info("Loading input JSON: %s", args.input)
-    with open(args.input, "r", encoding="utf-8") as f:
-        root = json.load(f)
+    if orjson is not None:
+        with open(args.input, "rb") as f:
+            root = orjson.loads(f.read())
+    else:
+        with open(args.input, "r", encoding="utf-8") as f:
+            root = json.load(f)
 
     counts = normalize_individual_names(root)
 
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(root, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # orjson encodes straight to UTF-8 bytes in native code.
+        with open(args.output, "wb") as f:
+            f.write(orjson.dumps(root, option=orjson.OPT_INDENT_2))
+    else:
+        # Serialize to one string and write it in a single call: json.dump
+        # feeds the encoder's many small chunks through the text wrapper one
+        # by one, which is measurably slower on multi-hundred-MB exports.
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(json.dumps(root, ensure_ascii=False, indent=2))
 
     log.info(
         "Name normalization complete: individuals=%d name_blocks=%d created=%d updated=%d "
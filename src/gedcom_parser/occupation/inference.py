@@ -1,10 +1,16 @@
 import json
 import os
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 _OCCUPATION_MAP_CACHE: Dict[str, List[str]] | None = None
 
+# Compiled once at import: re.sub with a literal still pays the pattern
+# cache lookup and hashing per call, which adds up when _normalize_text
+# runs once per OCCU/NOTE value per individual.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
 
 def load_occupation_map() -> Dict[str, List[str]]:
     """
@@ -27,16 +33,70 @@ def load_occupation_map() -> Dict[str, List[str]]:
     return _OCCUPATION_MAP_CACHE
 
 
+@lru_cache(maxsize=4096)
 def _normalize_text(text: str) -> str:
     """
     Lowercase and strip to alphanumeric plus spaces.
     Good enough for simple substring matching.
+
+    Cached: OCCU values repeat heavily across a registry ("Farmer",
+    "Clerk", ...), and the map variants are normalized through here at
+    scanner-build time, so repeats skip the lower/sub/strip work.
     """
     text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", " ", text)
+    text = _NON_ALNUM_RE.sub(" ", text)
     return text.strip()
 
 
+# Dictionary scanner built once per occupation map (an Aho-Corasick-style
+# automaton, realized with the stdlib regex engine rather than a compiled
+# third-party dependency). Holds:
+#   pattern:      overlapping scanner — a zero-width lookahead wrapping an
+#                 alternation of all normalized variants, longest first
+#   prefixes_of:  variant -> shorter variants that are its prefixes; the
+#                 scanner reports the longest hit at each position, so its
+#                 matching prefixes are credited from this table
+#   canon_entries: (canonical, [(vnorm, original_variant), ...]) in map
+#                 order, for reconstructing the result pairs
+#   first_chars:  every character a variant can start with, for a
+#                 cheap no-match reject before scanning
+# One-slot memo keyed by the map object's identity: in practice every
+# call passes the load_occupation_map() singleton, but a custom or
+# reloaded map must not be answered with the previous map's scanner.
+_VARIANT_SCANNER_CACHE: Tuple[int, Tuple[Any, ...]] | None = None
+
+
+def _variant_scanner(occ_map: Dict[str, List[str]]) -> Tuple[Any, ...]:
+    global _VARIANT_SCANNER_CACHE
+    if _VARIANT_SCANNER_CACHE is not None and _VARIANT_SCANNER_CACHE[0] == id(occ_map):
+        return _VARIANT_SCANNER_CACHE[1]
+
+    canon_entries: List[Tuple[str, List[Tuple[str, str]]]] = []
+    all_vnorms: set = set()
+    for canonical, variants in occ_map.items():
+        entry = []
+        for variant in variants:
+            vnorm = _normalize_text(variant)
+            if vnorm:
+                entry.append((vnorm, variant))
+                all_vnorms.add(vnorm)
+        canon_entries.append((canonical, entry))
+
+    by_length = sorted(all_vnorms, key=len, reverse=True)
+    pattern = re.compile(
+        "(?=(" + "|".join(map(re.escape, by_length)) + "))"
+    ) if by_length else None
+    prefixes_of = {
+        v: [w for w in by_length if w != v and v.startswith(w)]
+        for v in by_length
+    }
+    first_chars = frozenset(v[0] for v in all_vnorms)
+
+    scanner = (pattern, prefixes_of, canon_entries, first_chars)
+    _VARIANT_SCANNER_CACHE = (id(occ_map), scanner)
+    return scanner
+
+
 def _find_occupations_in_text(
     text: str,
     occ_map: Dict[str, List[str]],
@@ -44,6 +104,12 @@ def _find_occupations_in_text(
     """
     Given some free text and the occupation map, return a list of
     (canonical, matched_variant) pairs that appear in that text.
+
+    One overlapping scan over the text replaces the old canonical x
+    variant substring loop (and its per-variant re-normalization), so
+    cost is O(len(text)) per call instead of O(variants * len(text)).
+    Results keep the original semantics: map order, first matching
+    variant per canonical.
     """
     results: List[Tuple[str, str]] = []
     if not text:
@@ -53,14 +119,33 @@ def _find_occupations_in_text(
     if not norm_text:
         return results
 
-    for canonical, variants in occ_map.items():
-        for variant in variants:
-            vnorm = _normalize_text(variant)
-            if not vnorm:
-                continue
-            if vnorm in norm_text:
-                results.append((canonical, variant))
-                break  # only need one variant hit per canonical
+    pattern, prefixes_of, canon_entries, first_chars = _variant_scanner(occ_map)
+    if pattern is None:
+        return results
+
+    # Quick reject: isdisjoint short-circuits on the first shared
+    # character, so texts that can't possibly contain a variant skip the
+    # alternation scan entirely.
+    if first_chars.isdisjoint(norm_text):
+        return results
+
+    # The lookahead makes matches zero-width, so finditer probes every
+    # position and the capture reports the longest variant starting
+    # there; any shorter variant at that position is one of its prefixes.
+    found: set = set()
+    add = found.add
+    for m in pattern.finditer(norm_text):
+        v = m.group(1)
+        if v not in found:
+            add(v)
+            found.update(prefixes_of[v])
+
+    if found:
+        for canonical, entry in canon_entries:
+            for vnorm, variant in entry:
+                if vnorm in found:
+                    results.append((canonical, variant))
+                    break  # only need one variant hit per canonical
 
     return results
 
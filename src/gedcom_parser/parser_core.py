@@ -4,7 +4,7 @@ Central parsing engine with full logging integration.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from gedcom_parser.config import get_config
 from gedcom_parser.logger import get_logger
@@ -28,7 +28,7 @@ class GEDCOMParser:
         self.cfg = config if config is not None else get_config()
         self.log = get_logger("parser_core")
 
-        self.tokens: List[Dict[str, Any]] = []
+        self.tokens: Iterable[Any] = []
         self.roots: List[Dict[str, Any]] = []
         self.entity_registry = None
 
@@ -38,17 +38,22 @@ class GEDCOMParser:
     # Load file
     # ---------------------------------------------------------
     def load_file(self, path: str) -> None:
-        """Tokenize GEDCOM input into list of tokens."""
-        self.log.info(f"Tokenizing GEDCOM input: {path}")
-        try:
-            # FORCE materialization of generator
-            self.tokens = list(tokenize_file(path))
-        except Exception:
-            self.log.exception("Tokenization failed.")
-            raise
-
+        """Tokenize GEDCOM input into a token stream."""
+        self.log.info("Tokenizing GEDCOM input: %s", path)
         if self.cfg.debug:
-            self.log.debug(f"Token count = {len(self.tokens)}")
+            # Debug wants a token count, which needs materialization.
+            try:
+                self.tokens = list(tokenize_file(path))
+            except Exception:
+                self.log.exception("Tokenization failed.")
+                raise
+            self.log.debug("Token count = %d", len(self.tokens))
+        else:
+            # Leave the generator unconsumed: build_tree feeds it straight
+            # into the segmenter, so peak memory is the tree alone instead
+            # of tree plus full token list. Tokenization errors surface
+            # during run(), which already logs parse failures.
+            self.tokens = tokenize_file(path)
 
     # ---------------------------------------------------------
     # Reconstruct + Build Tree + Extract Entities
@@ -63,7 +68,7 @@ class GEDCOMParser:
         self.log.info("Running parser engine...")
 
         try:
-            # tree builder now accepts LIST
+            # build_tree consumes the token stream lazily
             self.roots = build_tree(self.tokens)
             reconstruct_values(self.roots)
 
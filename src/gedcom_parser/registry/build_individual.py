@@ -23,6 +23,11 @@ def _first_child_value(node, tag: str) -> Optional[str]:
     return None
 
 
+# Structured NAME sub-tags mapped onto NameRecord fields; everything else
+# lands in NameRecord.raw.
+_NAME_SUB_TAGS = {"GIVN", "SURN", "NPFX", "NSFX", "NICK", "TYPE"}
+
+
 def _node_to_event_dict(node) -> Dict[str, Any]:
     return {
         "tag": getattr(node, "tag", None),
@@ -46,21 +51,30 @@ def build_individual(node) -> IndividualEntity:
         pointer=pointer,
     )
 
-    # Names
+    # Names — one pass over each NAME node's children instead of one
+    # _first_child_value scan per structured sub-tag.
     for name_node in _child_nodes_by_tag(node, "NAME"):
+        sub_values: Dict[str, Any] = {}
+        raw_subs: Dict[str, Any] = {}
+        for sub in _iter_children(name_node):
+            stag = getattr(sub, "tag", None)
+            if not stag:
+                continue
+            if stag in _NAME_SUB_TAGS:
+                sub_values.setdefault(stag, getattr(sub, "value", None))
+            else:
+                raw_subs[stag] = getattr(sub, "value", None)
+
         name = NameRecord(
             full=getattr(name_node, "value", None) or "",
-            given=_first_child_value(name_node, "GIVN"),
-            surname=_first_child_value(name_node, "SURN"),
-            prefix=_first_child_value(name_node, "NPFX"),
-            suffix=_first_child_value(name_node, "NSFX"),
-            nickname=_first_child_value(name_node, "NICK"),
-            name_type=_first_child_value(name_node, "TYPE"),
+            given=sub_values.get("GIVN"),
+            surname=sub_values.get("SURN"),
+            prefix=sub_values.get("NPFX"),
+            suffix=sub_values.get("NSFX"),
+            nickname=sub_values.get("NICK"),
+            name_type=sub_values.get("TYPE"),
         )
-        for sub in _iter_children(name_node):
-            stag = getattr(sub, "tag", None)
-            if stag and stag not in {"GIVN", "SURN", "NPFX", "NSFX", "NICK", "TYPE"}:
-                name.raw[stag] = getattr(sub, "value", None)
+        name.raw.update(raw_subs)
         individual.names.append(name)
 
     # Gender
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from gedcom_parser.events.event import (
+    _to_ymd,
     extract_event,
     extract_events_from_record,
     is_event_tag,
@@ -55,3 +56,21 @@ def test_extract_events_from_record():
     tags = {e.tag for e in events}
     assert tags == {"MARR", "DIV"}
     assert events[0].uuid.startswith("evt-F9")
+
+
+def test_to_ymd_rejects_impossible_calendar_dates():
+    assert _to_ymd("1900-02-31") is None
+    assert _to_ymd("1900-04-31") is None
+    assert _to_ymd("1900-13-01") is None
+
+
+def test_to_ymd_applies_leap_rule_to_february():
+    assert _to_ymd("2000-02-29") == (2000, 2, 29)
+    assert _to_ymd("1904-02-29") == (1904, 2, 29)
+    # 1900 is divisible by 100 but not 400: not a leap year
+    assert _to_ymd("1900-02-29") is None
+
+
+def test_to_ymd_defaults_missing_month_and_day():
+    assert _to_ymd("1900") == (1900, 1, 1)
+    assert _to_ymd("1900-06") == (1900, 6, 1)
@@ -0,0 +1,51 @@
+# tests/test_json_exporter.py
+
+from __future__ import annotations
+
+import gzip
+import json
+
+from gedcom_parser.exporter.json_exporter import export_registry_json
+from gedcom_parser.registry.entities import GedcomRegistry, IndividualEntity, NameRecord
+
+
+def _small_registry() -> GedcomRegistry:
+    reg = GedcomRegistry()
+    ind = IndividualEntity(uuid="indi-I1", pointer="@I1@")
+    ind.names.append(NameRecord(full="John /Doe/"))
+    reg.register_individual(ind)
+    return reg
+
+
+def test_export_registry_json_writes_valid_json(tmp_path) -> None:
+    out = tmp_path / "export.json"
+    export_registry_json(_small_registry(), out)
+
+    root = json.loads(out.read_text(encoding="utf-8"))
+    assert root["individuals"]["@I1@"]["pointer"] == "@I1@"
+    assert root["individuals"]["@I1@"]["names"][0]["full"] == "John /Doe/"
+
+
+def test_export_registry_json_compress_writes_gzip(tmp_path) -> None:
+    """
+    compress=True must append .gz to the path and produce gzip output that
+    decodes to the same JSON as the uncompressed export.
+    """
+    plain = tmp_path / "export.json"
+    export_registry_json(_small_registry(), plain)
+
+    export_registry_json(_small_registry(), tmp_path / "export2.json", compress=True)
+    gz_path = tmp_path / "export2.json.gz"
+    assert gz_path.exists()
+
+    with gzip.open(gz_path, "rt", encoding="utf-8") as f:
+        compressed_root = json.load(f)
+    assert compressed_root == json.loads(plain.read_text(encoding="utf-8"))
+
+
+def test_export_registry_json_compress_keeps_explicit_gz_suffix(tmp_path) -> None:
+    out = tmp_path / "export.json.gz"
+    export_registry_json(_small_registry(), out, compress=True)
+
+    assert out.exists()
+    assert not (tmp_path / "export.json.gz.gz").exists()
@@ -0,0 +1,68 @@
+# tests/test_name_block.py
+
+from __future__ import annotations
+
+from gedcom_parser.entities.name_block import parse_name_block
+from gedcom_parser.normalization.name_normalization import normalize_individual_names
+
+
+def test_surname_prefix_single_particle() -> None:
+    nb = parse_name_block(raw_full="Ludwig /van Beethoven/")
+
+    assert nb.parsed.surname_prefix == "van"
+    assert nb.parsed.surname == "Beethoven"
+    assert nb.normalized.surname_prefix == "Van"
+
+
+def test_surname_prefix_compound_particles() -> None:
+    nb = parse_name_block(raw_full="Pieter /van der Meer/")
+
+    assert nb.parsed.surname_prefix == "van der"
+    assert nb.parsed.surname == "Meer"
+
+    nb2 = parse_name_block(raw_full="Maria /de la Cruz/")
+    assert nb2.parsed.surname_prefix == "de la"
+    assert nb2.parsed.surname == "Cruz"
+
+
+def test_surname_prefix_keeps_full_canonical_form() -> None:
+    """Peeling must not change the normalized full-name string."""
+    nb = parse_name_block(raw_full="Pieter /van der Meer/")
+    assert nb.normalized.full == "pieter van der meer"
+
+
+def test_all_particle_surname_is_not_peeled() -> None:
+    """A surname made only of particles keeps its last token as surname."""
+    nb = parse_name_block(raw_full="John /Van/")
+    assert nb.parsed.surname == "Van"
+    assert nb.parsed.surname_prefix is None
+
+    nb2 = parse_name_block(raw_full="Anna /van der/")
+    assert nb2.parsed.surname == "der"
+    assert nb2.parsed.surname_prefix == "van"
+
+
+def test_plain_surname_unaffected() -> None:
+    nb = parse_name_block(raw_full="David Thomas /Menzies/")
+    assert nb.parsed.surname == "Menzies"
+    assert nb.parsed.surname_prefix is None
+
+
+def test_fill_recombines_peeled_surname() -> None:
+    """
+    Filling a missing surname from the parsed block must restore the
+    full particle-bearing form, not the peeled remainder.
+    """
+    root = {
+        "individuals": {
+            "@I1@": {
+                "names": [{"full": "Pieter /van der Meer/"}],
+            },
+        },
+    }
+
+    counts = normalize_individual_names(root)
+
+    name_rec = root["individuals"]["@I1@"]["names"][0]
+    assert name_rec["surname"] == "van der Meer"
+    assert counts["filled_surname"] == 1
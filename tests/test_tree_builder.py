@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from gedcom_parser.loader import GEDCOMTree, tokenize_file, build_tree
+import pytest
+
+from gedcom_parser.loader import (
+    GEDCOMStructureError,
+    GEDCOMTree,
+    build_tree,
+    reconstruct_values,
+    segment_records,
+    stream_records,
+    tokenize_file,
+)
 from gedcom_parser.utils import mock_file_path
 
 
@@ -68,3 +78,70 @@ def test_tree_head_records_lookup_by_tag() -> None:
     assert heads, "Expected at least one HEAD record"
     assert all(rec.level == 0 for rec in heads)
     assert all(rec.tag == "HEAD" for rec in heads)
+
+
+def _node_shape(node) -> tuple:
+    """Structural fingerprint of a node subtree for equality checks."""
+    return (
+        node.level,
+        node.tag,
+        node.pointer,
+        node.value,
+        tuple(_node_shape(c) for c in node.children),
+    )
+
+
+def test_stream_records_matches_batch_pipeline() -> None:
+    """
+    stream_records must produce the same records as the batch
+    tokenize → segment_records → reconstruct_values pipeline.
+    """
+    path = mock_file_path("gedcom_1.ged")
+
+    batch = segment_records(tokenize_file(str(path)))
+    reconstruct_values(batch)
+
+    streamed = list(stream_records(str(path)))
+
+    assert len(streamed) == len(batch)
+    for s_rec, b_rec in zip(streamed, batch):
+        assert _node_shape(s_rec) == _node_shape(b_rec)
+
+
+def test_stream_records_merges_continuations(tmp_path) -> None:
+    """
+    CONC/CONT lines must be merged into the parent value on the stream
+    path, with the continuation children removed.
+    """
+    ged = tmp_path / "conc.ged"
+    ged.write_text(
+        "0 HEAD\n"
+        "0 @N1@ NOTE first part\n"
+        "1 CONC  continued\n"
+        "1 CONT second line\n"
+        "0 TRLR\n",
+        encoding="utf-8",
+    )
+
+    records = list(stream_records(str(ged)))
+    note = next(r for r in records if r.tag == "NOTE")
+
+    assert note.value == "first part continued\nsecond line"
+    assert not note.find_children("CONC")
+    assert not note.find_children("CONT")
+
+
+def test_stream_records_raises_on_level_jump(tmp_path) -> None:
+    """
+    A level jump without an intermediate parent must still raise
+    GEDCOMStructureError from the streaming path.
+    """
+    ged = tmp_path / "bad.ged"
+    ged.write_text(
+        "0 HEAD\n"
+        "2 GEDC bad jump\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(GEDCOMStructureError):
+        list(stream_records(str(ged)))
@@ -0,0 +1,54 @@
+# tests/test_uuid_hash_selection.py
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+_UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+_SNIPPET = (
+    "from gedcom_parser.identity.uuid_factory import deterministic_uuid;"
+    "print(deterministic_uuid('INDI', '@I1@'))"
+)
+
+
+def _uuid_with_backend(backend: str | None) -> str:
+    """
+    Compute a UUID in a fresh interpreter with GEDCOM_UUID_HASH set.
+
+    The hash backend is selected at import time, so each backend needs
+    its own process rather than a reload in this one.
+    """
+    env = dict(os.environ)
+    env.pop("GEDCOM_UUID_HASH", None)
+    if backend is not None:
+        env["GEDCOM_UUID_HASH"] = backend
+    out = subprocess.run(
+        [sys.executable, "-c", _SNIPPET],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return out.stdout.strip()
+
+
+def test_default_backend_is_sha1() -> None:
+    """Unset and explicit sha1 must agree, and SHA1 stays the default."""
+    default = _uuid_with_backend(None)
+    sha1 = _uuid_with_backend("sha1")
+
+    assert _UUID_RE.match(default)
+    assert default == sha1
+
+
+def test_blake2_backend_is_deterministic_and_distinct() -> None:
+    blake2_a = _uuid_with_backend("blake2")
+    blake2_b = _uuid_with_backend("blake2")
+
+    assert _UUID_RE.match(blake2_a)
+    assert blake2_a == blake2_b
+    assert blake2_a != _uuid_with_backend(None)